@@ -0,0 +1,87 @@
+# animation.py
+
+
+class FrameAnimator:
+    """
+    Drive the animations of a window from its frame clock.
+
+    Animations are step functions called once per frame with the seconds
+    elapsed since the previous frame, so motion depends on time rather than
+    on how punctually the main loop runs. A single tick callback serves
+    every running animation and is removed as soon as none is left, so an
+    idle window does not wake up at all. Frames are only produced while the
+    widget is mapped: a hidden window costs nothing either.
+    """
+    # Longest interval applied in one frame (e.g. after the window was hidden)
+    MAX_FRAME_INTERVAL = 0.25
+
+    def __init__(self, widget):
+        """
+        Args:
+            widget (Gtk.Widget): Widget whose frame clock paces the animations.
+        """
+        self._widget = widget
+        self._steps = {}
+        self._tick_id = None
+        self._last_time = None
+        self._in_tick = False
+
+    def start(self, name, step):
+        """
+        Run an animation, replacing the running one with the same name.
+
+        Args:
+            name (str): Animation name, e.g. "scroll".
+            step (callable): Called every frame with the elapsed seconds;
+                returns False once the animation is finished.
+        """
+        self._steps[name] = step
+        if self._tick_id is None:
+            self._last_time = None
+            self._tick_id = self._widget.add_tick_callback(self._on_tick)
+
+    def stop(self, name):
+        """Stop an animation (no-op if it is not running)."""
+        self._steps.pop(name, None)
+        if not self._steps:
+            self._remove_tick()
+
+    def stop_all(self):
+        """Stop every animation."""
+        self._steps.clear()
+        self._remove_tick()
+
+    def is_running(self, name):
+        """Return True if the named animation is running."""
+        return name in self._steps
+
+    def _remove_tick(self):
+        # Within a tick, returning False from it removes the callback
+        if self._tick_id is not None and not self._in_tick:
+            self._widget.remove_tick_callback(self._tick_id)
+            self._tick_id = None
+
+    def _on_tick(self, widget, frame_clock):
+        """Advance every animation by the time elapsed since the last frame."""
+        now = frame_clock.get_frame_time() / 1_000_000
+        if self._last_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = min(now - self._last_time, self.MAX_FRAME_INTERVAL)
+        self._last_time = now
+
+        self._in_tick = True
+        try:
+            for name, step in list(self._steps.items()):
+                # Skip animations stopped or replaced by an earlier step
+                if self._steps.get(name) is not step:
+                    continue
+                if not step(elapsed) and self._steps.get(name) is step:
+                    del self._steps[name]
+        finally:
+            self._in_tick = False
+
+        if self._steps:
+            return True
+        self._tick_id = None
+        return False
@@ -0,0 +1,287 @@
+# async_scraper.py
+import asyncio
+import urllib.error
+import urllib.parse
+
+from .mirrors import mirrors
+from .scraper import (
+    FreetarSearchParser, FreetarTabsParser, HttpSession, decode_body, search_url, session
+)
+
+
+class AsyncHttpSession:
+    """
+    Asyncio counterpart of HttpSession, built on asyncio streams.
+
+    Connections are kept alive and pooled per (scheme, host, port), and at
+    most max_concurrency requests run at once, so thousands of pages can be
+    fetched from a single thread without opening thousands of sockets.
+    Errors are raised as urllib.error exceptions, like HttpSession.
+
+    A session belongs to the event loop that first uses it; its pool and
+    semaphore are reset if it is used from another loop.
+    """
+    def __init__(self, max_concurrency=16, connect_timeout=5.0, read_timeout=10.0,
+                 max_idle_per_host=8, max_redirects=5):
+        self.max_concurrency = max_concurrency
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.headers = dict(session.headers)
+        self._loop = None
+        self._semaphore = None
+        self._idle = {}
+
+    def _bind_loop(self):
+        """Create the semaphore and pool for the running loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._idle = {}
+
+    async def get(self, url, headers=None):
+        """
+        Perform a GET request, following redirects.
+
+        Args:
+            url (str): Absolute http(s) URL.
+            headers (dict): Extra request headers.
+
+        Returns:
+            bytes: The decoded (decompressed) response body.
+        """
+        self._bind_loop()
+        request_headers = dict(self.headers)
+        if headers:
+            request_headers.update(headers)
+
+        async with self._semaphore:
+            for _ in range(self.max_redirects + 1):
+                status, reason, response_headers, body = await self._request(url, request_headers)
+                location = response_headers.get("location")
+                if status in HttpSession.REDIRECT_CODES and location:
+                    url = urllib.parse.urljoin(url, location)
+                    continue
+                if status >= 400:
+                    raise urllib.error.HTTPError(url, status, reason, response_headers, None)
+                return decode_body(response_headers.get("content-encoding"), body)
+
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+    async def get_text(self, url, headers=None):
+        """Perform a GET request and return the body decoded as UTF-8."""
+        return (await self.get(url, headers)).decode("utf-8")
+
+    async def close(self):
+        """Close every idle pooled connection."""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for _, writer in connections:
+                writer.close()
+
+    # -----------------------
+    # Connections
+    # -----------------------
+    async def _request(self, url, headers):
+        """
+        Send one request on a pooled connection and read the whole response.
+
+        Returns:
+            tuple: (status, reason, lower-cased headers dict, raw body)
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"Unsupported URL: {url}")
+
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        host = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+        lines = [f"GET {path} HTTP/1.1", f"Host: {host}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+        connection, reused = self._acquire(key)
+        try:
+            try:
+                if connection is None:
+                    connection = await self._connect(key)
+                response = await self._exchange(connection, request)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server dropped an idle keep-alive connection: retry once on a fresh one
+                if connection is not None:
+                    connection[1].close()
+                if not reused:
+                    raise
+                connection = await self._connect(key)
+                response = await self._exchange(connection, request)
+        except urllib.error.URLError:
+            raise
+        except asyncio.CancelledError:
+            # E.g. a hedged request that lost: the response was not read to the end
+            if connection is not None:
+                connection[1].close()
+            raise
+        except (OSError, asyncio.IncompleteReadError, asyncio.TimeoutError, ValueError) as e:
+            if connection is not None:
+                connection[1].close()
+            raise urllib.error.URLError(e)
+
+        status, reason, response_headers, body, will_close = response
+        if will_close:
+            connection[1].close()
+        else:
+            self._release(key, connection)
+        return status, reason, response_headers, body
+
+    async def _exchange(self, connection, request):
+        """Write a request and read its response within the read timeout."""
+        reader, writer = connection
+        writer.write(request)
+        await asyncio.wait_for(writer.drain(), self.read_timeout)
+        return await asyncio.wait_for(self._read_response(reader), self.read_timeout)
+
+    @staticmethod
+    async def _read_response(reader):
+        """Parse an HTTP/1.1 response: status line, headers, then a length-delimited, chunked or close-delimited body."""
+        while True:
+            status_line = await reader.readline()
+            if not status_line:
+                raise asyncio.IncompleteReadError(b"", None)
+            version, status, *reason = status_line.decode("latin-1").split(" ", 2)
+            status = int(status)
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            # Skip interim responses (100 Continue...)
+            if status >= 200:
+                break
+
+        connection_header = headers.get("connection", "").lower()
+        will_close = connection_header == "close" or (version == "HTTP/1.0" and connection_header != "keep-alive")
+
+        if status in (204, 304):
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            pieces = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0].strip(), 16)
+                if size == 0:
+                    # Trailers end with an empty line
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                pieces.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(pieces)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        else:
+            body = await reader.read()
+            will_close = True
+
+        reason = reason[0].strip() if reason else ""
+        return status, reason, headers, body, will_close
+
+    def _acquire(self, key):
+        """Return (idle connection or None, reused)."""
+        connections = self._idle.get(key)
+        while connections:
+            connection = connections.pop()
+            if not connection[0].at_eof():
+                return connection, True
+            connection[1].close()
+        return None, False
+
+    def _release(self, key, connection):
+        """Put a connection back in the idle pool of its host."""
+        connections = self._idle.setdefault(key, [])
+        if len(connections) < self.max_idle_per_host:
+            connections.append(connection)
+        else:
+            connection[1].close()
+
+    async def _connect(self, key):
+        """Open a connection within the connect timeout."""
+        scheme, host, port = key
+        if port is None:
+            port = 443 if scheme == "https" else 80
+        try:
+            return await asyncio.wait_for(
+                asyncio.open_connection(host, port, ssl=(scheme == "https") or None),
+                self.connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise urllib.error.URLError(e)
+
+
+# Shared session: set async_session.max_concurrency before first use to tune it
+async_session = AsyncHttpSession()
+
+
+async def _mirrored_get_text(url, http):
+    """Fetch a page from the best Freetar mirror, with the same hedging and failover as the blocking scraper."""
+    path = mirrors.path_of(url)
+    if path is None:
+        return await http.get_text(url)
+    return await mirrors.call_async(path, http.get_text)
+
+
+async def async_fetch_freetar_results(song_name, http=None, page=1):
+    """
+    Fetch search results from Freetar for a given song name, without blocking.
+
+    Args:
+        song_name (str): Name of the song to search for.
+        http (AsyncHttpSession): Session to use (async_session by default).
+        page (int): Results page, starting at 1.
+
+    Returns:
+        list: List of song dictionaries ([] on error).
+    """
+    url = search_url(song_name, page)
+    try:
+        html_content = await _mirrored_get_text(url, http or async_session)
+    except urllib.error.URLError as e:
+        print(f"Error fetching URL {url}: {e}")
+        return []
+
+    parser = FreetarSearchParser()
+    parser.feed(html_content)
+    return parser.songs
+
+
+async def async_get_song_details(url, http=None):
+    """
+    Download, parse, and clean song tab details from a URL, without blocking.
+
+    Many songs can be fetched concurrently, e.g. with
+    asyncio.gather(*(async_get_song_details(url) for url in urls));
+    the session's semaphore bounds the requests actually in flight.
+
+    Args:
+        url (str): URL of the song tab page.
+        http (AsyncHttpSession): Session to use (async_session by default).
+
+    Returns:
+        dict: Dictionary containing song metadata and tab content ({} on error).
+    """
+    if not url:
+        return {}
+
+    try:
+        html_content = await _mirrored_get_text(url, http or async_session)
+    except urllib.error.URLError as e:
+        print(f"Error fetching URL {url}: {e}")
+        return {}
+
+    parser = FreetarTabsParser()
+    parser.feed(html_content)
+    return parser.finish()
@@ -0,0 +1,123 @@
+# cache.py
+from collections import OrderedDict
+import time
+
+
+class LRUCache:
+    """
+    Dict-backed least-recently-used cache for songs and searches.
+
+    Hits and insertions are O(1) and refresh the entry's recency, so a song
+    opened every day stays cached while one-off lookups are evicted first.
+
+    Negative entries (keys known to have no value, e.g. a search without
+    results) live in a separate short-lived table: they never take a slot
+    in the LRU and are not persisted.
+
+    An optional byte budget bounds the cache by the size of its values
+    (as measured by sizeof) in addition to the entry count.
+
+    Attributes:
+        max_entries (int): Maximum number of positive entries kept.
+        negative_ttl (float): Seconds a negative entry stays valid.
+        max_bytes (int): Maximum total size of the values, or None.
+    """
+    def __init__(self, max_entries, negative_ttl=30.0, max_bytes=None, sizeof=None):
+        self.max_entries = max_entries
+        self.negative_ttl = negative_ttl
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof or (lambda value: 0)
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._bytes = 0
+        self._negative = {}
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Return the value for key and mark it as most recently used."""
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return default
+        return self._entries[key]
+
+    @property
+    def total_bytes(self):
+        """Total size of the cached values, as measured by sizeof."""
+        return self._bytes
+
+    def put(self, key, value):
+        """
+        Insert or refresh an entry, evicting least recently used ones while over a limit.
+
+        The entry just inserted is never evicted, even if it alone exceeds max_bytes.
+
+        Returns:
+            list: The evicted keys.
+        """
+        self._negative.pop(key, None)
+        self.pop(key)
+        size = self._sizeof(value)
+        self._entries[key] = value
+        self._sizes[key] = size
+        self._bytes += size
+
+        evicted = []
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            evicted_key = next(iter(self._entries))
+            self.pop(evicted_key)
+            evicted.append(evicted_key)
+        return evicted
+
+    def pop(self, key, default=None):
+        """Remove an entry and return its value."""
+        if key not in self._entries:
+            return default
+        self._bytes -= self._sizes.pop(key)
+        return self._entries.pop(key)
+
+    def mark_missing(self, key):
+        """Record that key has no value, replacing any cached entry."""
+        self.pop(key)
+        self._negative[key] = time.monotonic() + self.negative_ttl
+
+    def is_missing(self, key):
+        """Return True if key was recently recorded as having no value."""
+        expires = self._negative.get(key)
+        if expires is None:
+            return False
+        if expires < time.monotonic():
+            del self._negative[key]
+            return False
+        return True
+
+    def to_list(self):
+        """
+        Serialize the cache for cache.json.
+
+        Returns:
+            list: [key, value] pairs, least recently used first.
+        """
+        return [[key, value] for key, value in self._entries.items()]
+
+    @classmethod
+    def from_list(cls, items, max_entries, **kwargs):
+        """
+        Rebuild a cache from the list format written by to_list().
+
+        Empty values written by older versions are dropped: they were
+        negative entries and are not worth keeping across sessions.
+        """
+        cache = cls(max_entries, **kwargs)
+        for key, value in items or []:
+            if value:
+                cache.put(key, value)
+        return cache
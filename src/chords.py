@@ -0,0 +1,29 @@
+# chords.py
+import re
+
+# Pattern for identifying chords in tab content, compiled once
+CHORD_PATTERN = re.compile(r'([A-G][b#]?(m|min|maj|sus|aug|dim|add|7|9|11|13)*(\/[A-G][b#]?)?)\b')
+
+
+def compute_chord_spans(tab_content):
+    """
+    Find the chords of a tab once, so they can be cached with the song.
+
+    Spans are delta-encoded to stay compact and to be applied by walking a
+    text buffer forward: each pair is (characters since the end of the
+    previous chord, length of the chord).
+
+    Args:
+        tab_content (str): The tab content with chords and lyrics.
+
+    Returns:
+        list: Flat list [gap, length, gap, length, ...] in character offsets.
+    """
+    spans = []
+    previous_end = 0
+    for match in CHORD_PATTERN.finditer(tab_content):
+        start, end = match.span(1)
+        spans.append(start - previous_end)
+        spans.append(end - start)
+        previous_end = end
+    return spans
@@ -24,6 +24,7 @@ gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
 from gi.repository import Gtk, Gio, Adw
+from .startup import trace_first_frame
 from .window import TabsWindow
 
 class TabsApplication(Adw.Application):
@@ -36,6 +37,9 @@ class TabsApplication(Adw.Application):
             resource_base_path='/org/clero/tabs'
         )
 
+        # Mis à True si le temps de démarrage dépasse le budget (TABS_STARTUP_TIMING=exit)
+        self.startup_over_budget = False
+
         # Création des actions
         self.create_action('quit', lambda *_: self.quit(), ['<primary>q'])
         self.create_action('about', self.on_about_action)
@@ -46,8 +50,16 @@ class TabsApplication(Adw.Application):
         win = self.props.active_window
         if not win:
             win = TabsWindow(application=self)
+            trace_first_frame(win, self)
         win.present()
 
+    def do_shutdown(self):
+        """Appelé à la fermeture : termine les sauvegardes en attente."""
+        for win in self.get_windows():
+            if isinstance(win, TabsWindow):
+                win.shutdown()
+        Adw.Application.do_shutdown(self)
+
     def on_about_action(self, *args):
         """Callback pour l'action app.about."""
         about = Adw.AboutDialog(
@@ -76,5 +88,8 @@ class TabsApplication(Adw.Application):
 def main(version):
     """Point d’entrée de l’application."""
     app = TabsApplication()
-    return app.run(sys.argv)
+    status = app.run(sys.argv)
+    if app.startup_over_budget:
+        return 1
+    return status
 
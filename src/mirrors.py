@@ -0,0 +1,314 @@
+# mirrors.py
+import asyncio
+import threading
+import time
+import urllib.error
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# Public Freetar instance used when no mirror is configured. Song URLs keep
+# this base whatever mirror served them, so cache keys don't depend on it.
+DEFAULT_MIRROR = "https://freetar.habedieeh.re/"
+SONG_KEY_BASE = DEFAULT_MIRROR
+
+
+class MirrorStats:
+    """Health of one mirror: smoothed latency and error rate, and circuit breaker state."""
+    def __init__(self, base, initial_latency):
+        self.base = base
+        self.latency = initial_latency
+        self.error_rate = 0.0
+        self.samples = deque(maxlen=50)
+        self.failures = 0
+        self.open_until = 0.0
+
+    def percentile(self, fraction, default):
+        """Return a latency percentile of recent successful requests."""
+        if len(self.samples) < 5:
+            return default
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class MirrorPool:
+    """
+    Route requests to the healthiest of several Freetar instances.
+
+    Each mirror's latency and error rate are tracked with an exponentially
+    weighted moving average (EWMA). Requests go to the best scoring mirror;
+    if it has not answered by its usual p90 latency, counted from when the
+    request actually starts, a hedged duplicate is sent to the next one and
+    the first answer wins. A mirror failing
+    several times in a row is skipped for a cooldown that doubles up to
+    max_cooldown (circuit breaker), then tried again. Thread-safe.
+    """
+    def __init__(self, bases=(DEFAULT_MIRROR,), alpha=0.3, hedge_percentile=0.9,
+                 default_hedge_delay=1.0, min_hedge_delay=0.2, failure_threshold=3,
+                 cooldown=30.0, max_cooldown=300.0):
+        self.alpha = alpha
+        self.hedge_percentile = hedge_percentile
+        self.default_hedge_delay = default_hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tabs-mirror")
+        self.set_mirrors(bases)
+
+    @property
+    def bases(self):
+        """Configured mirror base URLs, in configuration order."""
+        with self._lock:
+            return list(self._stats)
+
+    def set_mirrors(self, bases):
+        """
+        Replace the mirror list, keeping the statistics of mirrors still listed.
+
+        Args:
+            bases (iterable): Base URLs such as "https://freetar.example/".
+        """
+        bases = [base if base.endswith("/") else base + "/" for base in bases if base]
+        with self._lock:
+            old = self._stats
+            # Unknown mirrors start slightly worse than the configured first one
+            self._stats = {
+                base: old.get(base) or MirrorStats(base, 0.5 + 0.1 * i)
+                for i, base in enumerate(bases or [DEFAULT_MIRROR])
+            }
+
+    # -----------------------
+    # URLs
+    # -----------------------
+    def path_of(self, url):
+        """
+        Return the mirror-independent path of a Freetar URL.
+
+        Args:
+            url (str): URL on the key base or on any configured mirror.
+
+        Returns:
+            str: The path after the base (e.g. "tab/artist/song-123"), or None
+            for a URL that belongs to no mirror.
+        """
+        for base in [SONG_KEY_BASE] + self.bases:
+            if url.startswith(base):
+                return url[len(base):]
+        return None
+
+    # -----------------------
+    # Routing
+    # -----------------------
+    def ranked(self):
+        """Return usable mirrors, best first; mirrors whose circuit is open come last."""
+        now = time.monotonic()
+        with self._lock:
+            stats = list(self._stats.values())
+        available = [s for s in stats if s.open_until <= now]
+        broken = sorted((s for s in stats if s.open_until > now), key=lambda s: s.open_until)
+        available.sort(key=lambda s: s.latency * (1 + 4 * s.error_rate))
+        return [s.base for s in available + broken]
+
+    def call(self, path, func):
+        """
+        Run func(url) against the best mirror, hedging and failing over to others.
+
+        Args:
+            path (str): Mirror-independent path, appended to each mirror base.
+            func (callable): Blocking request taking the full URL.
+
+        Returns:
+            The result of the first successful call.
+
+        Raises:
+            urllib.error.URLError: The error of the last mirror tried if all
+            of them failed. Client errors (HTTP 4xx) are raised at once, since
+            every mirror would give the same answer.
+        """
+        candidates = self.ranked()
+        if len(candidates) == 1:
+            return self._timed(candidates[0], func, candidates[0] + path)
+
+        running = {}
+        started = {}
+        last_error = None
+
+        def launch():
+            base = candidates.pop(0)
+            started[base] = threading.Event()
+            future = self._executor.submit(self._timed, base, func, base + path, started[base])
+            running[future] = base
+            return base
+
+        primary = launch()
+        while running:
+            if candidates and len(running) == 1:
+                # Time spent queued behind other requests is no sign of a slow
+                # mirror: the hedge delay runs from when the request starts
+                started[primary].wait()
+                timeout = self._hedge_delay(primary)
+            else:
+                timeout = None
+            done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                # Slower than usual: hedge with the next mirror
+                print(f"Hedging request to {candidates[0]}")
+                launch()
+                continue
+            for future in done:
+                running.pop(future)
+                try:
+                    result = future.result()
+                except urllib.error.HTTPError as e:
+                    if e.code < 500:
+                        self._discard(running)
+                        raise
+                    last_error = e
+                except urllib.error.URLError as e:
+                    last_error = e
+                else:
+                    self._discard(running)
+                    return result
+            if not running and candidates:
+                primary = launch()
+
+        raise last_error
+
+    async def call_async(self, path, func):
+        """
+        Coroutine counterpart of call(): same ranking, hedging, failover and breaker.
+
+        Args:
+            path (str): Mirror-independent path, appended to each mirror base.
+            func (callable): Coroutine function taking the full URL.
+
+        Returns:
+            The result of the first successful call; losing requests are cancelled.
+
+        Raises:
+            urllib.error.URLError: As call().
+        """
+        candidates = self.ranked()
+        if len(candidates) == 1:
+            return await self._timed_async(candidates[0], func, candidates[0] + path)
+
+        running = {}
+        last_error = None
+
+        def launch():
+            base = candidates.pop(0)
+            task = asyncio.ensure_future(self._timed_async(base, func, base + path))
+            running[task] = base
+            return base
+
+        primary = launch()
+        try:
+            while running:
+                if candidates and len(running) == 1:
+                    timeout = self._hedge_delay(primary)
+                else:
+                    timeout = None
+                done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    # Slower than usual: hedge with the next mirror
+                    print(f"Hedging request to {candidates[0]}")
+                    launch()
+                    continue
+                for task in done:
+                    running.pop(task)
+                    try:
+                        result = task.result()
+                    except urllib.error.HTTPError as e:
+                        if e.code < 500:
+                            raise
+                        last_error = e
+                    except urllib.error.URLError as e:
+                        last_error = e
+                    else:
+                        return result
+                if not running and candidates:
+                    primary = launch()
+        finally:
+            for task in running:
+                task.cancel()
+
+        raise last_error
+
+    def _hedge_delay(self, base):
+        with self._lock:
+            stats = self._stats.get(base)
+        if stats is None:
+            return self.default_hedge_delay
+        delay = stats.percentile(self.hedge_percentile, self.default_hedge_delay)
+        return max(self.min_hedge_delay, delay)
+
+    @staticmethod
+    def _discard(running):
+        """Let losing requests finish in the background, releasing what they return."""
+        for future in running:
+            future.add_done_callback(_close_result)
+
+    def _timed(self, base, func, url, started=None):
+        """Run one request and record its outcome for the mirror (setting started first, if given)."""
+        start = time.monotonic()
+        if started is not None:
+            started.set()
+        try:
+            result = func(url)
+        except urllib.error.URLError as e:
+            self._record_error(base, start, e)
+            raise
+        self.record(base, time.monotonic() - start, ok=True)
+        return result
+
+    async def _timed_async(self, base, func, url):
+        """Await one request and record its outcome for the mirror."""
+        start = time.monotonic()
+        try:
+            result = await func(url)
+        except urllib.error.URLError as e:
+            self._record_error(base, start, e)
+            raise
+        self.record(base, time.monotonic() - start, ok=True)
+        return result
+
+    def _record_error(self, base, start, error):
+        """Record a failed request started at `start`."""
+        # A client error is an answer, not a sign of a broken mirror
+        ok = isinstance(error, urllib.error.HTTPError) and error.code < 500
+        self.record(base, time.monotonic() - start, ok=ok)
+
+    def record(self, base, latency, ok):
+        """Update the EWMAs and circuit breaker of a mirror after a request."""
+        with self._lock:
+            stats = self._stats.get(base)
+            if stats is None:
+                return
+            stats.error_rate += self.alpha * ((0.0 if ok else 1.0) - stats.error_rate)
+            if ok:
+                stats.latency += self.alpha * (latency - stats.latency)
+                stats.samples.append(latency)
+                stats.failures = 0
+                stats.open_until = 0.0
+                return
+            stats.failures += 1
+            if stats.failures >= self.failure_threshold:
+                extra = stats.failures - self.failure_threshold
+                cooldown = min(self.max_cooldown, self.cooldown * (2 ** extra))
+                stats.open_until = time.monotonic() + cooldown
+                print(f"Mirror {base} unavailable, skipped for {cooldown:.0f} s")
+
+
+def _close_result(future):
+    """Close the result of an abandoned request if it holds a connection (e.g. a stream)."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    close = getattr(future.result(), "close", None)
+    if close is not None:
+        close()
+
+
+# Shared pool used by the scraper; configured from config.json ("mirrors")
+mirrors = MirrorPool()
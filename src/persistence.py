@@ -0,0 +1,109 @@
+# persistence.py
+import json
+import os
+import queue
+import tempfile
+import threading
+from gi.repository import GLib
+
+
+def atomic_write_json(path, data):
+    """
+    Write JSON data so that path holds either the old or the new content, never a partial file.
+
+    The data goes to a temporary file in the same directory, which is
+    flushed, fsynced and renamed over the destination.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Persist the rename itself
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class PersistenceWriter:
+    """
+    Save state in the background shortly after it changes.
+
+    schedule() debounces a named save: the state is snapshotted on the main
+    loop once changes settle down, then written by a dedicated writer
+    thread. submit() queues a write immediately. Writes run one at a time,
+    in order. The thread is not a daemon, so queued writes still complete
+    after the window has closed.
+    """
+    def __init__(self, delay_ms=500):
+        self.delay_ms = delay_ms
+        self._pending = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="tabs-writer")
+        self._thread.start()
+
+    def schedule(self, name, snapshot, write):
+        """
+        Debounce a save.
+
+        Args:
+            name (str): Identifies the save; rescheduling it restarts the delay.
+            snapshot (callable): Called on the main loop, returns the data to save.
+            write (callable): Called on the writer thread with the snapshot.
+        """
+        pending = self._pending.get(name)
+        if pending is not None:
+            GLib.source_remove(pending[0])
+        source_id = GLib.timeout_add(self.delay_ms, self._fire, name)
+        self._pending[name] = (source_id, snapshot, write)
+
+    def submit(self, func, *args):
+        """Queue func(*args) on the writer thread."""
+        self._queue.put((func, args))
+
+    def flush(self):
+        """Snapshot every pending save now instead of waiting for its delay."""
+        for name in list(self._pending):
+            GLib.source_remove(self._pending[name][0])
+            self._fire(name)
+
+    def close(self):
+        """Flush pending saves and let the writer thread exit once the queue is empty."""
+        self.flush()
+        self._queue.put(None)
+
+    def _fire(self, name):
+        """Main loop side: snapshot the state and hand it to the writer thread."""
+        _, snapshot, write = self._pending.pop(name)
+        self.submit(write, snapshot())
+        return GLib.SOURCE_REMOVE
+
+    def _run(self):
+        """Writer thread: run queued writes until close() is called."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                break
+            func, args = job
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"Could not save data: {e}")
@@ -0,0 +1,190 @@
+# prefetch.py
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from gi.repository import GLib
+
+# Result types most likely to be opened first (lower is better)
+TYPE_PRIORITY = {"chords": 0, "tab": 1, "ukulele": 2}
+
+
+def rank_results(songs):
+    """
+    Order search results by how likely they are to be opened.
+
+    Chords come before tabs and other types; within a type, higher rated
+    results come first, and the page order breaks ties.
+
+    Args:
+        songs (list): Song dictionaries as returned by the scraper.
+
+    Returns:
+        list: The same dictionaries, most likely first.
+    """
+    def key(indexed):
+        index, song = indexed
+        type_rank = TYPE_PRIORITY.get(str(song.get("type", "")).strip().lower(), len(TYPE_PRIORITY))
+        try:
+            rating = float(song.get("rating", 0))
+        except (TypeError, ValueError):
+            rating = 0.0
+        return (type_rank, -rating, index)
+
+    return [song for _, song in sorted(enumerate(songs), key=key)]
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter: allows bursts of `capacity` requests, then
+    `rate` requests per second. Not thread-safe; used from the main loop.
+    """
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def take(self):
+        """
+        Take one token if available.
+
+        Returns:
+            float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class SongPrefetcher:
+    """
+    Warm the song cache in the background for results the user is likely
+    to open next.
+
+    Candidates are queued on the main loop; hovered or pressed rows jump
+    the queue. Requests are rate limited by a token bucket and at most
+    `max_per_host` of them run at once against the same host, so
+    prefetching never competes much with the user's own requests.
+    All public methods must be called from the main loop.
+    """
+    def __init__(self, fetch, on_fetched, is_cached, max_per_host=2,
+                 rate=2.0, burst=4, max_queued=10):
+        """
+        Args:
+            fetch (callable): Worker thread: url -> song dictionary ({} on error).
+            on_fetched (callable): Main loop: called with (url, song_data) on success.
+            is_cached (callable): Main loop: url -> True if no prefetch is needed.
+            max_per_host (int): Concurrent prefetches allowed per host.
+            rate (float): Sustained prefetches per second.
+            burst (int): Prefetches allowed back to back.
+            max_queued (int): Older candidates are dropped beyond this.
+        """
+        self._fetch = fetch
+        self._on_fetched = on_fetched
+        self._is_cached = is_cached
+        self._max_per_host = max_per_host
+        self._bucket = TokenBucket(rate, burst)
+        self._queue = deque(maxlen=max_queued)
+        self._in_flight = {}
+        self._per_host = {}
+        self._timer_id = None
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_per_host,
+            thread_name_prefix="tabs-prefetch"
+        )
+
+    # -----------------------
+    # Queueing
+    # -----------------------
+    def prefetch_results(self, songs, top_n=5):
+        """Queue the `top_n` most likely results of a search, replacing older candidates."""
+        self.cancel()
+        for song in rank_results(songs)[:top_n]:
+            url = song.get("song_url")
+            if url:
+                self._queue.append(url)
+        self._pump()
+
+    def prefetch(self, url):
+        """Queue a single song ahead of the others (hovered or pressed row)."""
+        if not url or url in self._in_flight:
+            return
+        try:
+            self._queue.remove(url)
+        except ValueError:
+            pass
+        self._queue.appendleft(url)
+        self._pump()
+
+    def cancel(self):
+        """Forget queued candidates; requests already sent are left to finish."""
+        self._queue.clear()
+        if self._timer_id is not None:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+
+    def shutdown(self):
+        """Drop queued work and stop accepting results."""
+        self.cancel()
+        self._closed = True
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -----------------------
+    # Dispatch
+    # -----------------------
+    def _pump(self):
+        """Start as many queued prefetches as the host caps and rate limit allow."""
+        if self._closed or self._timer_id is not None:
+            return
+        skipped = []
+        while self._queue:
+            url = self._queue.popleft()
+            if url in self._in_flight or self._is_cached(url):
+                continue
+            host = urlsplit(url).netloc
+            if self._per_host.get(host, 0) >= self._max_per_host:
+                skipped.append(url)
+                continue
+            wait = self._bucket.take()
+            if wait:
+                self._queue.appendleft(url)
+                self._timer_id = GLib.timeout_add(int(wait * 1000) + 1, self._on_timer)
+                break
+            self._start(url, host)
+        # Host-capped candidates keep their place for the next round
+        self._queue.extendleft(reversed(skipped))
+
+    def _on_timer(self):
+        self._timer_id = None
+        self._pump()
+        return GLib.SOURCE_REMOVE
+
+    def _start(self, url, host):
+        self._per_host[host] = self._per_host.get(host, 0) + 1
+        future = self._executor.submit(self._fetch, url)
+        self._in_flight[url] = future
+        future.add_done_callback(
+            lambda future: GLib.idle_add(self._finish, url, host, future)
+        )
+
+    def _finish(self, url, host, future):
+        """Main loop side: release the host slot and hand over the result."""
+        self._in_flight.pop(url, None)
+        self._per_host[host] -= 1
+        if self._closed:
+            return GLib.SOURCE_REMOVE
+        if not future.cancelled() and future.exception() is None:
+            song_data = future.result()
+            if song_data:
+                self._on_fetched(url, song_data)
+        self._pump()
+        return GLib.SOURCE_REMOVE
@@ -1,31 +1,393 @@
 import urllib.parse
-import urllib.request
 import urllib.error
 from html.parser import HTMLParser
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import codecs
+import gzip
+import zlib
+import hashlib
 import html
 import re
 
+from .mirrors import mirrors, SONG_KEY_BASE
+from .singleflight import SingleFlight
+
+
+class HttpSession:
+    """
+    Small keep-alive HTTP client shared by the scraper functions.
+
+    Idle connections are pooled per (scheme, host, port) so consecutive
+    requests to the same Freetar instance skip the TCP and TLS handshakes.
+    Responses are requested with gzip/deflate compression and decoded
+    transparently. Errors are raised as urllib.error exceptions so callers
+    can handle them exactly like urllib.request.urlopen failures.
+
+    Attributes:
+        connect_timeout (float): Seconds allowed to establish a connection.
+        read_timeout (float): Seconds allowed between reads of a response.
+    """
+    RETRYABLE_ERRORS = (
+        http.client.RemoteDisconnected,
+        http.client.BadStatusLine,
+        ConnectionResetError,
+        BrokenPipeError,
+    )
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    def __init__(self, connect_timeout=5.0, read_timeout=10.0, max_idle_per_host=4, max_redirects=5):
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_idle_per_host = max_idle_per_host
+        self.max_redirects = max_redirects
+        self.headers = {
+            "User-Agent": "Mozilla/5.0",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, headers=None):
+        """
+        Perform a GET request, following redirects.
+
+        Args:
+            url (str): Absolute http(s) URL.
+            headers (dict): Extra request headers.
+
+        Returns:
+            bytes: The decoded (decompressed) response body.
+        """
+        _, body = self._fetch(url, headers)
+        return body
+
+    def get_if_modified(self, url, validators=None, headers=None):
+        """
+        Perform a conditional GET request, following redirects.
+
+        The ETag and Last-Modified headers of a previous response are sent
+        back as If-None-Match / If-Modified-Since, so a server that supports
+        them answers 304 Not Modified without resending the body.
+
+        Args:
+            url (str): Absolute http(s) URL.
+            validators (dict): "etag" and "last_modified" of a previous response.
+            headers (dict): Extra request headers.
+
+        Returns:
+            tuple: (decoded body, or None if unchanged; validators of this response)
+        """
+        validators = dict(validators or {})
+        request_headers = dict(headers or {})
+        if validators.get("etag"):
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+
+        response, body = self._fetch(url, request_headers)
+        for field, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            value = response.getheader(header)
+            if value:
+                validators[field] = value
+        return body, validators
+
+    def _fetch(self, url, headers):
+        """
+        Perform a GET request, following redirects.
+
+        Returns:
+            tuple: (final response, decoded body or None for 304 Not Modified)
+        """
+        request_headers = dict(self.headers)
+        if headers:
+            request_headers.update(headers)
+
+        for _ in range(self.max_redirects + 1):
+            key, conn, response = self._open(url, request_headers)
+            body = self._read_all(key, conn, response)
+            location = response.getheader("Location")
+            if response.status in self.REDIRECT_CODES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if response.status == 304:
+                return response, None
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return response, self._decode_body(response, body)
+
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+    def stream(self, url, headers=None, chunk_size=16384):
+        """
+        Perform a GET request and yield the body as it arrives, following redirects.
+
+        Chunks are decompressed on the fly. If the caller stops iterating
+        early, the connection is closed instead of being reused.
+
+        Args:
+            url (str): Absolute http(s) URL.
+            headers (dict): Extra request headers.
+            chunk_size (int): Maximum number of bytes read from the socket at once.
+
+        Yields:
+            bytes: Decoded (decompressed) pieces of the response body.
+        """
+        request_headers = dict(self.headers)
+        if headers:
+            request_headers.update(headers)
+
+        for _ in range(self.max_redirects + 1):
+            key, conn, response = self._open(url, request_headers)
+            location = response.getheader("Location")
+            if response.status in self.REDIRECT_CODES and location:
+                self._read_all(key, conn, response)
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if response.status >= 400:
+                self._read_all(key, conn, response)
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+
+            encoding = (response.getheader("Content-Encoding") or "").strip().lower()
+            decompressor = None
+            if encoding in ("gzip", "x-gzip"):
+                decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+            completed = False
+            try:
+                while True:
+                    chunk = response.read1(chunk_size)
+                    if not chunk:
+                        break
+                    if encoding == "deflate" and decompressor is None:
+                        # Some servers send raw deflate data without the zlib header
+                        has_header = len(chunk) >= 2 and (chunk[0] & 0x0F) == 8 and ((chunk[0] << 8) | chunk[1]) % 31 == 0
+                        decompressor = zlib.decompressobj(zlib.MAX_WBITS if has_header else -zlib.MAX_WBITS)
+                    data = decompressor.decompress(chunk) if decompressor else chunk
+                    if data:
+                        yield data
+                if decompressor is not None:
+                    data = decompressor.flush()
+                    if data:
+                        yield data
+                completed = True
+            except zlib.error as e:
+                raise urllib.error.URLError(f"Could not decode {encoding} response: {e}")
+            except (OSError, http.client.HTTPException) as e:
+                raise urllib.error.URLError(e)
+            finally:
+                if completed and not response.will_close:
+                    # read1() never marks a Content-Length body as done: close
+                    # the response so the connection accepts a new request
+                    response.close()
+                    self._release(key, conn)
+                else:
+                    conn.close()
+            return
+
+        raise urllib.error.URLError(f"Too many redirects for {url}")
+
+    def get_text(self, url, headers=None):
+        """Perform a GET request and return the body decoded as UTF-8."""
+        return self.get(url, headers).decode("utf-8")
+
+    def close(self):
+        """Close every idle pooled connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _open(self, url, headers):
+        """
+        Send one request on a pooled connection and read the response headers.
+
+        Returns:
+            tuple: (pool key, connection, response whose body is still unread)
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"Unsupported URL: {url}")
+
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        conn, reused = self._acquire(key)
+        try:
+            try:
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+            except self.RETRYABLE_ERRORS:
+                # The server dropped an idle keep-alive connection: retry once on a fresh one
+                conn.close()
+                if not reused:
+                    raise
+                conn, reused = self._connect(key), False
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+        except urllib.error.URLError:
+            conn.close()
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+        return key, conn, response
+
+    def _read_all(self, key, conn, response):
+        """Read a whole response body, then give the connection back to the pool."""
+        try:
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+        return body
+
+    def _acquire(self, key):
+        """Return an idle connection for the host, or open a new one."""
+        with self._lock:
+            connections = self._idle.get(key)
+            if connections:
+                return connections.pop(), True
+        return self._connect(key), False
+
+    def _release(self, key, conn):
+        """Put a connection back in the idle pool of its host."""
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.max_idle_per_host:
+                connections.append(conn)
+                return
+        conn.close()
+
+    def _connect(self, key):
+        """Open a connection with the connect timeout, then switch to the read timeout."""
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.connect_timeout)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.connect_timeout)
+        try:
+            conn.connect()
+        except OSError as e:
+            conn.close()
+            raise urllib.error.URLError(e)
+        conn.sock.settimeout(self.read_timeout)
+        return conn
+
+    @staticmethod
+    def _decode_body(response, body):
+        """Undo the Content-Encoding of a response body."""
+        return decode_body(response.getheader("Content-Encoding"), body)
+
+
+def decode_body(encoding, body):
+    """
+    Undo a Content-Encoding (gzip or deflate) of a complete response body.
+
+    Args:
+        encoding (str): Value of the Content-Encoding header, or None.
+        body (bytes): Body as received.
+
+    Returns:
+        bytes: The decompressed body.
+    """
+    encoding = (encoding or "").strip().lower()
+    try:
+        if encoding in ("gzip", "x-gzip"):
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate data without the zlib header
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+    except (OSError, zlib.error) as e:
+        raise urllib.error.URLError(f"Could not decode {encoding} response: {e}")
+    return body
+
+
+# Shared session: adjust session.connect_timeout / session.read_timeout to tune timeouts
+session = HttpSession()
+
+# Requests in flight, shared by concurrent callers asking for the same page
+# (double taps, prefetches, background refreshes). See inflight.stats().
+inflight = SingleFlight()
+
+
+def _validators_key(validators):
+    """Hashable form of a validators dictionary, for in-flight request keys."""
+    return tuple(sorted(validators.items())) if validators else None
+
+
+def _mirrored(url, func):
+    """
+    Run func(url) on the best Freetar mirror, or directly for other sites.
+
+    Args:
+        url (str): Freetar URL (any mirror, or the song key base) or other URL.
+        func (callable): Blocking request taking the URL to use.
+    """
+    path = mirrors.path_of(url)
+    if path is None:
+        return func(url)
+    return mirrors.call(path, func)
+
+
+class _OpenedStream:
+    """A streamed response whose headers and first chunk have been received."""
+    def __init__(self, url):
+        self._chunks = session.stream(url)
+        self.first = next(self._chunks, b"")
+
+    def __iter__(self):
+        if self.first:
+            yield self.first
+        yield from self._chunks
+
+    def close(self):
+        """Stop reading; the connection is closed unless the body was fully read."""
+        self._chunks.close()
+
 
 class FreetarSearchParser(HTMLParser):
     """
     HTML parser to extract song search results from Freetar.
 
+    The page can be fed in chunks: each song is complete (and passed to
+    on_song, if given) as soon as its closing </tr> has been fed.
+
     Attributes:
         songs (list): List of dictionaries containing song info.
+        page_count (int): Highest results page linked from the page (1 if
+            there is no pagination).
     """
-    def __init__(self):
+    def __init__(self, on_song=None):
         super().__init__()
+        self.on_song = on_song
+        self.page_count = 1
         self.in_tr = False
         self.in_td = False
         self.current_class = ""
         self.current_data = {}
         self.songs = []
         self.current_tag = ""
+        self._text = []
 
     def handle_starttag(self, tag, attrs):
         """
         Handle the start of an HTML tag.
         """
+        self._flush_text()
         attrs = dict(attrs)
         self.current_tag = tag
 
@@ -41,18 +403,37 @@ class FreetarSearchParser(HTMLParser):
             if "rating" in self.current_class and "data-value" in attrs:
                 self.current_data["rating"] = attrs["data-value"]
 
+        elif tag == "a" and not self.in_td:
+            # Pagination links: "search?search_term=...&page=N"
+            query = urllib.parse.urlsplit(attrs.get("href") or "").query
+            page = urllib.parse.parse_qs(query).get("page", [""])[0]
+            if page.isdigit():
+                self.page_count = max(self.page_count, int(page))
+
         elif tag == "a" and self.in_td:
             href = attrs.get("href", "")
             if "artist" in self.current_class:
                 self.current_data["artist_url"] = href
             elif "song" in self.current_class:
-                # Add base URL for completeness
-                self.current_data["song_url"] = "https://freetar.habedieeh.re/" + href
+                # Add base URL for completeness. The same base is used whatever
+                # mirror served the page, so the URL is a stable cache key.
+                self.current_data["song_url"] = SONG_KEY_BASE + href
 
     def handle_data(self, data):
+        """
+        Buffer text until the next tag: a chunk boundary can split a text run in several calls.
+        """
+        self._text.append(data)
+
+    def _flush_text(self):
         """
         Handle the text content inside HTML tags.
         """
+        if not self._text:
+            return
+        data = "".join(self._text)
+        self._text.clear()
+
         if not self.in_tr or not self.in_td:
             return
 
@@ -73,12 +454,15 @@ class FreetarSearchParser(HTMLParser):
         """
         Handle the end of an HTML tag.
         """
+        self._flush_text()
         if tag == "td":
             self.in_td = False
             self.current_class = ""
         elif tag == "tr":
             if self.current_data:
                 self.songs.append(self.current_data)
+                if self.on_song is not None:
+                    self.on_song(self.current_data)
             self.in_tr = False
 
 
@@ -97,41 +481,207 @@ def extract_songs_from_html(html_content):
     return parser.songs
 
 
-def fetch_freetar_results(song_name):
+def search_url(song_name, page=1):
+    """Return the Freetar search page URL for a query (resolved to a mirror when fetched)."""
+    url = f"{SONG_KEY_BASE}search?search_term={urllib.parse.quote(song_name)}"
+    if page > 1:
+        url += f"&page={page}"
+    return url
+
+
+def fetch_if_modified(url, validators=None):
+    """
+    Download a page again only if it changed since it was last fetched.
+
+    Besides the HTTP validators, a digest of the body is kept, so a server
+    without ETag/Last-Modified support still lets callers skip parsing an
+    unchanged page.
+
+    Args:
+        url (str): Page URL.
+        validators (dict): Validators returned by the previous call, if any.
+
+    Returns:
+        tuple: (page text, or None if unchanged; validators for the next call)
+
+    Raises:
+        urllib.error.URLError: If the page could not be downloaded.
+    """
+    body, new_validators = _mirrored(url, lambda url: session.get_if_modified(url, validators))
+    if body is None:
+        print(f"Not modified: {url}")
+        return None, new_validators
+
+    digest = hashlib.sha1(body).hexdigest()
+    new_validators["digest"] = digest
+    if validators and validators.get("digest") == digest:
+        print(f"Unchanged: {url}")
+        return None, new_validators
+    return body.decode("utf-8"), new_validators
+
+
+def fetch_freetar_results_if_modified(song_name, validators=None):
+    """
+    Fetch search results again only if the results page changed.
+
+    Args:
+        song_name (str): Name of the song to search for.
+        validators (dict): Validators of the previous fetch, if any.
+
+    Returns:
+        tuple: (list of song dictionaries, or None if unchanged; validators)
+
+    Raises:
+        urllib.error.URLError: If the page could not be downloaded.
+    """
+    return inflight.do(
+        ("search-if-modified", song_name, _validators_key(validators)),
+        _fetch_freetar_results_if_modified, song_name, validators
+    )
+
+
+def _fetch_freetar_results_if_modified(song_name, validators):
+    html_content, validators = fetch_if_modified(search_url(song_name), validators)
+    if html_content is None:
+        return None, validators
+    return extract_songs_from_html(html_content), validators
+
+
+def fetch_freetar_results(song_name, page=1):
     """
     Fetch search results from Freetar for a given song name.
 
     Args:
         song_name (str): Name of the song to search for.
+        page (int): Results page, starting at 1.
 
     Returns:
         list: List of song dictionaries.
     """
-    query = urllib.parse.quote(song_name)
-    url = f"https://freetar.habedieeh.re/search?search_term={query}"
+    return list(iter_freetar_results(song_name, page))
+
+
+def iter_freetar_results(song_name, page=1):
+    """
+    Stream search results from Freetar for a given song name.
+
+    The response is parsed as it arrives, so the first songs are available
+    before the whole page has been downloaded.
+
+    Args:
+        song_name (str): Name of the song to search for.
+        page (int): Results page, starting at 1.
+
+    Yields:
+        dict: Song dictionaries, in page order.
+
+    Returns:
+        int: Number of results pages linked from the page (1 on error).
+    """
+    return (yield from inflight.stream(("search", song_name, page), _iter_freetar_results, song_name, page))
+
+
+def iter_freetar_pages(song_name, max_pages=3, page_count=None, on_page_count=None):
+    """
+    Stream the results of several search pages.
+
+    The first page is streamed as it is parsed; it tells how many pages
+    there are, and the following ones (up to max_pages) are then fetched
+    concurrently and yielded as each one completes, so they may arrive out
+    of order. Rows are not de-duplicated across pages.
+
+    Args:
+        song_name (str): Name of the song to search for.
+        max_pages (int): Maximum number of pages to fetch.
+        page_count (int): Number of pages, if already known from an earlier
+            fetch of the first page: only the follow-up pages are fetched.
+        on_page_count (callable): Called (on this thread) with the number of
+            pages once the first page has been parsed.
+
+    Yields:
+        tuple: (page, song dictionary) for each result, then (page, None)
+        once a page is complete.
+    """
+    if page_count is None:
+        results = iter_freetar_results(song_name)
+        while True:
+            try:
+                song = next(results)
+            except StopIteration as stop:
+                page_count = stop.value or 1
+                break
+            yield 1, song
+        if on_page_count is not None:
+            on_page_count(page_count)
+        yield 1, None
+
+    pages = range(2, min(page_count, max_pages) + 1)
+    if not pages:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=len(pages), thread_name_prefix="tabs-search")
+    try:
+        futures = {
+            executor.submit(fetch_freetar_results, song_name, page): page
+            for page in pages
+        }
+        for future in as_completed(futures):
+            page = futures[future]
+            for song in future.result():
+                yield page, song
+            yield page, None
+    finally:
+        # Stop waiting for pages nobody wants any more (search cancelled)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_freetar_results(song_name, page=1):
+    url = search_url(song_name, page)
 
     print("Fetching HTML page...")
-    headers = {"User-Agent": "Mozilla/5.0"}
-    req = urllib.request.Request(url, headers=headers)
+    ready = []
+    parser = FreetarSearchParser(on_song=ready.append)
+    decoder = codecs.getincrementaldecoder("utf-8")()
 
+    stream = None
     try:
-        with urllib.request.urlopen(req) as response:
-            html_content = response.read().decode("utf-8")
+        stream = _mirrored(url, _OpenedStream)
+        for chunk in stream:
+            parser.feed(decoder.decode(chunk))
+            yield from ready
+            ready.clear()
+        parser.feed(decoder.decode(b"", final=True))
     except urllib.error.URLError as e:
         print(f"Error fetching URL {url}: {e}")
-        return []
+        return 1
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        return 1
+    finally:
+        if stream is not None:
+            stream.close()
 
     print("HTML page retrieved")
-    songs = extract_songs_from_html(html_content)
-    return songs
+    yield from ready
+    return parser.page_count
 
 
 class FreetarTabsParser(HTMLParser):
     """
     Robust HTML parser for Freetar / Ultimate Guitar tabs.
 
-    Preserves line breaks and spacing in chords and tablature.
+    Preserves line breaks and spacing in chords and tablature. Everything is
+    extracted in a single pass over the HTML: tab text is collected in a
+    list and joined once by finish(), and difficulty, capo and tuning are
+    matched in the raw HTML of each chunk as the page is fed.
     """
+    # Metadata read from the raw song header HTML (first match wins)
+    METADATA_PATTERNS = (
+        ("difficulty", re.compile(r'Difficulty: (.*?)<br>')),
+        ("capo", re.compile(r'Capo: (.*?) </div>')),
+        ("tuning", re.compile(r'Tuning: (.*?) \(Standard\)<br>')),
+    )
+
     def __init__(self):
         super().__init__()
         self.details = {
@@ -149,6 +699,10 @@ class FreetarTabsParser(HTMLParser):
         self.tab_content_started = False
         self.ignore_data = False
         self.depth = 0
+        self._content = []
+        # Fields not found yet, and the last, unfinished line of raw HTML
+        self._metadata_missing = list(self.METADATA_PATTERNS)
+        self._metadata_tail = ""
 
     def handle_starttag(self, tag, attrs):
         """
@@ -188,7 +742,7 @@ class FreetarTabsParser(HTMLParser):
 
         # Tags that imply a line break
         if self.tab_content_started and tag in ("br", "p", "div", "tr"):
-            self.details["tab_content"] += "\n"
+            self._content.append("\n")
 
     def handle_data(self, data):
         """
@@ -200,7 +754,7 @@ class FreetarTabsParser(HTMLParser):
         text = html.unescape(data)
         if not text.strip() and not text.endswith("\n"):
             # Preserve actual spaces
-            self.details["tab_content"] += text.replace("\xa0", "\xa0\xa0")
+            self._content.append(text.replace("\xa0", "\xa0\xa0"))
             return
 
         if self.in_title_link and self.details["artist"] == "N/A":
@@ -208,7 +762,7 @@ class FreetarTabsParser(HTMLParser):
         elif self.in_h5 and self.details["artist"] != "N/A" and self.details["title"] == "N/A" and text not in ["-", self.details["artist"]]:
             self.details["title"] = text.replace('(ver 1)', '').strip()
         elif self.tab_content_started:
-            self.details["tab_content"] += text
+            self._content.append(text)
 
     def handle_endtag(self, tag):
         """
@@ -227,23 +781,46 @@ class FreetarTabsParser(HTMLParser):
 
         # Add line break at the end of paragraph-like tags
         if self.tab_content_started and tag in ("p", "div", "br", "tr"):
-            self.details["tab_content"] += "\n"
+            self._content.append("\n")
 
-    def set_metadata_from_raw_html(self, raw_html):
-        """
-        Extract metadata like difficulty, capo, and tuning using regex from raw HTML.
+    def feed(self, data):
+        """Feed a chunk of the page, looking for metadata in its raw HTML first."""
+        self._scan_metadata(data)
+        super().feed(data)
+
+    def _scan_metadata(self, data, final=False):
         """
-        difficulty_match = re.search(r'Difficulty: (.*?)<br>', raw_html)
-        if difficulty_match:
-            self.details["difficulty"] = difficulty_match.group(1).strip()
+        Run the metadata regexes over the complete lines received so far.
 
-        capo_match = re.search(r'Capo: (.*?) </div>', raw_html)
-        if capo_match:
-            self.details["capo"] = capo_match.group(1).strip()
+        The patterns never match across a line break, so searching line
+        blocks in order finds the same first match as searching the whole
+        page. The unfinished last line is kept for the next chunk.
+        """
+        if not self._metadata_missing:
+            return
+        text = self._metadata_tail + data
+        end = len(text) if final else text.rfind("\n") + 1
+        self._metadata_tail = text[end:]
+        block = text[:end]
+        for field, pattern in list(self._metadata_missing):
+            match = pattern.search(block)
+            if match:
+                self.details[field] = match.group(1).strip()
+                self._metadata_missing.remove((field, pattern))
+        if not self._metadata_missing:
+            self._metadata_tail = ""
+
+    def finish(self):
+        """
+        Assemble and clean the tab content once the whole page has been fed.
 
-        tuning_match = re.search(r'Tuning: (.*?) \(Standard\)<br>', raw_html)
-        if tuning_match:
-            self.details["tuning"] = tuning_match.group(1).strip()
+        Returns:
+            dict: The song details.
+        """
+        self._scan_metadata("", final=True)
+        self.details["tab_content"] = "".join(self._content)
+        self.clean_tab_content()
+        return self.details
 
     def clean_tab_content(self):
         """
@@ -254,15 +831,15 @@ class FreetarTabsParser(HTMLParser):
         """
         content = self.details["tab_content"]
 
-        # Remove scripts and "Alternative versions"
-        content = re.sub(r"\$\(document\).*", "", content, flags=re.DOTALL)
-        content = re.sub(r"Alternative versions.*", "", content, flags=re.DOTALL)
+        # Remove scripts and "Alternative versions" (everything after either marker)
+        for marker in ("$(document)", "Alternative versions"):
+            index = content.find(marker)
+            if index >= 0:
+                content = content[:index]
 
         # Clean up empty lines
-        lines = content.splitlines()
         cleaned_lines = []
-
-        for line in lines:
+        for line in content.splitlines():
             l = line.rstrip()
             if l.strip() == "":
                 if cleaned_lines and cleaned_lines[-1] != "":
@@ -270,13 +847,12 @@ class FreetarTabsParser(HTMLParser):
             else:
                 cleaned_lines.append(l)
 
-        # Remove leading/trailing empty lines
-        while cleaned_lines and cleaned_lines[0] == "":
-            cleaned_lines.pop(0)
-        while cleaned_lines and cleaned_lines[-1] == "":
-            cleaned_lines.pop(-1)
+        # Remove trailing empty lines (leading ones are never added above)
+        end = len(cleaned_lines)
+        while end and cleaned_lines[end - 1] == "":
+            end -= 1
 
-        self.details["tab_content"] = "\n".join(cleaned_lines)
+        self.details["tab_content"] = "\n".join(cleaned_lines[:end])
 
 
 def get_song_details(url):
@@ -291,13 +867,12 @@ def get_song_details(url):
     """
     if not url:
         return {}
+    return inflight.do(("song", url), _get_song_details, url)
 
-    headers = {"User-Agent": "Mozilla/5.0"}
 
+def _get_song_details(url):
     try:
-        req = urllib.request.Request(url, headers=headers)
-        with urllib.request.urlopen(req, timeout=10) as response:
-            html_content = response.read().decode("utf-8")
+        html_content = _mirrored(url, session.get_text)
     except urllib.error.URLError as e:
         print(f"Error fetching URL {url}: {e}")
         return {}
@@ -307,7 +882,35 @@ def get_song_details(url):
 
     parser = FreetarTabsParser()
     parser.feed(html_content)
-    parser.set_metadata_from_raw_html(html_content)
-    parser.clean_tab_content()
-    return parser.details
+    return parser.finish()
+
+
+def get_song_details_if_modified(url, validators=None):
+    """
+    Download and parse song details again only if the page changed.
+
+    Args:
+        url (str): URL of the song tab page.
+        validators (dict): Validators of the previous fetch, if any.
+
+    Returns:
+        tuple: (song details, or None if unchanged; validators for the next call)
+
+    Raises:
+        urllib.error.URLError: If the page could not be downloaded.
+    """
+    return inflight.do(
+        ("song-if-modified", url, _validators_key(validators)),
+        _get_song_details_if_modified, url, validators
+    )
+
+
+def _get_song_details_if_modified(url, validators):
+    html_content, validators = fetch_if_modified(url, validators)
+    if html_content is None:
+        return None, validators
+
+    parser = FreetarTabsParser()
+    parser.feed(html_content)
+    return parser.finish(), validators
 
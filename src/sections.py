@@ -0,0 +1,65 @@
+# sections.py
+import re
+
+from .chords import CHORD_PATTERN
+
+# Section markers on a line of their own: "[Verse 1]", "[Chorus]", "[Intro]"...
+SECTION_PATTERN = re.compile(r'^[ \t]*\[([A-Za-z][^\[\]/]{0,40})\][ \t]*$')
+# Beats assumed per chord line in tempo mode (one 4/4 bar)
+BEATS_PER_CHORD_LINE = 4
+
+
+def compute_line_index(tab_content):
+    """
+    Index the lines and sections of a tab once, so it can be cached with the song.
+
+    Args:
+        tab_content (str): The tab content with chords and lyrics.
+
+    Returns:
+        dict: {
+            "lines": number of lines,
+            "chord_lines": number of lines made only of chords,
+            "sections": [[name, line number, character offset], ...]
+        }
+    """
+    sections = []
+    chord_lines = 0
+    offset = 0
+    lines = tab_content.split("\n")
+    for number, line in enumerate(lines):
+        match = SECTION_PATTERN.match(line)
+        if match:
+            sections.append([match.group(1).strip(), number, offset])
+        elif _is_chord_line(line):
+            chord_lines += 1
+        offset += len(line) + 1
+    return {"lines": len(lines), "chord_lines": chord_lines, "sections": sections}
+
+
+def _is_chord_line(line):
+    """Return True if every word of a non-blank line is a chord."""
+    words = line.split()
+    return bool(words) and all(CHORD_PATTERN.fullmatch(word) for word in words)
+
+
+def song_duration(line_index, mode, duration=None, bpm=None):
+    """
+    Return how long scrolling through a whole song should take.
+
+    Args:
+        line_index (dict): Index from compute_line_index().
+        mode (str): "duration" (fixed length) or "tempo" (derived from the BPM).
+        duration (float): Song length in seconds, for "duration".
+        bpm (float): Tempo in beats per minute, for "tempo".
+
+    Returns:
+        float: Seconds, or None if the mode has no duration (free speed).
+    """
+    if mode == "duration" and duration:
+        return float(duration)
+    if mode == "tempo" and bpm:
+        # Tabs without chord lines: count every line as a bar
+        bars = line_index.get("chord_lines") or line_index.get("lines") or 1
+        return bars * BEATS_PER_CHORD_LINE * 60.0 / bpm
+    return None
@@ -0,0 +1,150 @@
+# singleflight.py
+import copy
+import threading
+
+
+class _Flight:
+    """One in-flight call: its result, or the items it has produced so far."""
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.done = False
+        self.abandoned = False
+        self.result = None
+        self.error = None
+        self.items = []
+
+
+class SingleFlight:
+    """
+    Share in-flight requests between concurrent callers with the same key.
+
+    The first caller for a key (the leader) performs the request; callers
+    arriving while it is running wait for it and get its result instead of
+    sending their own. Nothing is cached once the request completes.
+    Thread-safe.
+
+    Attributes:
+        hits (int): Calls served by a request already in flight.
+        misses (int): Calls that performed the request themselves.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights = {}
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Return the hit/miss counters and the number of requests in flight."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "in_flight": len(self._flights)}
+
+    def _join(self, key):
+        """Return (flight, is_leader) for a key."""
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is not None:
+                self.hits += 1
+                return flight, False
+            flight = self._flights[key] = _Flight()
+            self.misses += 1
+            return flight, True
+
+    def _land(self, key, flight):
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def do(self, key, func, *args):
+        """
+        Call func(*args), or wait for the identical call already in flight.
+
+        Followers get a deep copy of the leader's result, so callers can
+        modify what they get back without affecting each other.
+        Exceptions raised by the leader are raised in every caller.
+        """
+        flight, leader = self._join(key)
+        if not leader:
+            with flight.cond:
+                flight.cond.wait_for(lambda: flight.done)
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = func(*args)
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            self._land(key, flight)
+            with flight.cond:
+                flight.done = True
+                flight.cond.notify_all()
+        return flight.result
+
+    def stream(self, key, func, *args):
+        """
+        Iterate func(*args), or follow the identical iteration already in flight.
+
+        Followers first replay the items produced so far, then receive new
+        ones as the leader produces them. If the leader stops iterating
+        early, a follower continues with its own iteration, skipping the
+        items it already has. As with do(), every follower gets its own
+        deep copy of each item and of the return value.
+
+        Yields:
+            The items of func(*args), in order.
+
+        Returns:
+            The return value of the func(*args) generator.
+        """
+        flight, leader = self._join(key)
+        if leader:
+            completed = False
+            iterator = func(*args)
+            try:
+                while True:
+                    try:
+                        item = next(iterator)
+                    except StopIteration as stop:
+                        flight.result = stop.value
+                        break
+                    with flight.cond:
+                        # Kept as produced: the leader's caller may modify its item
+                        flight.items.append(copy.deepcopy(item))
+                        flight.cond.notify_all()
+                    yield item
+                completed = True
+            finally:
+                self._land(key, flight)
+                with flight.cond:
+                    flight.done = True
+                    flight.abandoned = not completed
+                    flight.cond.notify_all()
+            return flight.result
+
+        position = 0
+        while True:
+            with flight.cond:
+                flight.cond.wait_for(lambda: flight.done or len(flight.items) > position)
+                items = flight.items[position:]
+                finished = flight.done
+            for item in items:
+                yield copy.deepcopy(item)
+            position += len(items)
+            if finished:
+                break
+
+        if not flight.abandoned:
+            return copy.deepcopy(flight.result)
+
+        iterator = func(*args)
+        index = 0
+        while True:
+            try:
+                item = next(iterator)
+            except StopIteration as stop:
+                return stop.value
+            if index >= position:
+                yield item
+            index += 1
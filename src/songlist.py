@@ -0,0 +1,115 @@
+# songlist.py
+from gi.repository import Gtk, Adw, Gio, GLib, GObject, Pango
+
+
+class SongItem(GObject.Object):
+    """List model item wrapping a search-result song dictionary."""
+
+    __gtype_name__ = 'TabsSongItem'
+
+    def __init__(self, song):
+        super().__init__()
+        self.song = song
+
+
+def new_song_model(songs=()):
+    """
+    Build a list model for a Gtk.ListView from song dictionaries.
+
+    Args:
+        songs (iterable): Song dictionaries (as returned by the scraper).
+
+    Returns:
+        Gtk.NoSelection: Selection model wrapping a Gio.ListStore of SongItem.
+    """
+    store = Gio.ListStore(item_type=SongItem)
+    store.splice(0, 0, [SongItem(song) for song in songs])
+    return Gtk.NoSelection(model=store)
+
+
+def new_song_factory(on_hover=None):
+    """
+    Create the row factory shared by the results and favorites lists.
+
+    Row widgets are built once in "setup" and recycled: "bind" only updates
+    the label texts, so scrolling a long list never creates new widgets.
+
+    Args:
+        on_hover (callable): Called with the song of a row when the pointer
+            enters it or a finger presses it (a hint that it may be opened).
+    """
+    factory = Gtk.SignalListItemFactory()
+    factory.connect("setup", _on_setup, on_hover)
+    factory.connect("bind", _on_bind)
+    return factory
+
+
+def _on_setup(factory, list_item, on_hover):
+    """Build the card widgets of a row."""
+    # Grid container for song info
+    main_grid = Gtk.Grid(column_spacing=12, row_spacing=6)
+    main_grid.set_margin_top(15)
+    main_grid.set_margin_bottom(15)
+    main_grid.set_margin_start(15)
+    main_grid.set_margin_end(15)
+
+    # TITLE and ARTIST
+    title_label = Gtk.Label(label="", xalign=0)
+    # Enable word wrapping (GTK4)
+    title_label.set_wrap(True)
+    title_label.set_wrap_mode(Pango.WrapMode.WORD)
+    title_label.set_max_width_chars(100)
+    title_label.set_justify(Gtk.Justification.LEFT)
+    title_label.set_hexpand(True)
+    main_grid.attach(title_label, 0, 0, 2, 1)  # Takes 2 columns
+
+    artist_label = Gtk.Label(label="", xalign=0)
+    artist_label.add_css_class("body")
+    main_grid.attach(artist_label, 0, 1, 1, 1)
+
+    # TYPE and RATING aligned to the right
+    type_label = Gtk.Label(label="", xalign=0)
+    type_label.add_css_class("caption")
+    main_grid.attach(type_label, 0, 2, 1, 1)
+
+    rating_label = Gtk.Label(label="", xalign=1)
+    rating_label.add_css_class("caption")
+    main_grid.attach(rating_label, 1, 2, 1, 1)
+
+    # Card
+    card_bin = Adw.Bin()
+    card_bin.add_css_class("card")
+    card_bin.set_child(main_grid)
+    card_bin.labels = (title_label, artist_label, type_label, rating_label)
+    list_item.set_child(card_bin)
+
+    if on_hover is not None:
+        def notify_hover(*args):
+            item = list_item.get_item()
+            if item is not None:
+                on_hover(item.song)
+
+        motion = Gtk.EventControllerMotion()
+        motion.connect("enter", notify_hover)
+        card_bin.add_controller(motion)
+        # Capture phase: seen before the list view handles the click
+        press = Gtk.GestureClick()
+        press.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
+        press.connect("pressed", notify_hover)
+        card_bin.add_controller(press)
+
+
+def _on_bind(factory, list_item):
+    """Fill a recycled row with the song of its item."""
+    song = list_item.get_item().song
+    title_label, artist_label, type_label, rating_label = list_item.get_child().labels
+
+    title = GLib.markup_escape_text(song.get("song", "N/A"))
+    title_label.set_markup(f'<span size="large" weight="bold">{title}</span>')
+    artist_label.set_label(song.get('artist', 'N/A'))
+    type_label.set_label(f'Type: {song.get("type", "N/A")}')
+    if song.get("offline"):
+        # Local full-text hit: no rating, but it opens without network
+        rating_label.set_label("Available offline")
+    else:
+        rating_label.set_label(f'Rating: {song.get("rating_full", "0")}')
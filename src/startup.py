@@ -0,0 +1,84 @@
+# startup.py
+import os
+import time
+from gi.repository import GLib
+
+# Set TABS_STARTUP_TIMING=1 to print the time to first frame, or
+# TABS_STARTUP_TIMING=exit to also quit right after it, with exit status 1
+# when the time exceeds TABS_STARTUP_BUDGET_MS (used for regression checks).
+TIMING_ENV = "TABS_STARTUP_TIMING"
+BUDGET_ENV = "TABS_STARTUP_BUDGET_MS"
+DEFAULT_BUDGET_MS = 400.0
+
+# Reference point for the measurement: when the application modules are imported
+START_TIME = time.monotonic()
+
+
+def after_first_frame(widget, callback):
+    """
+    Run callback() once, from an idle handler, after widget's first frame has been painted.
+
+    Args:
+        widget (Gtk.Widget): Widget whose frame clock is watched.
+        callback (callable): Function called without arguments.
+    """
+    handler = {}
+
+    def run_callback():
+        callback()
+        return GLib.SOURCE_REMOVE
+
+    def on_after_paint(clock):
+        clock.disconnect(handler.pop("id"))
+        GLib.idle_add(run_callback)
+
+    def on_realize(widget):
+        widget.disconnect(handler.pop("realize"))
+        clock = widget.get_frame_clock()
+        handler["id"] = clock.connect("after-paint", on_after_paint)
+
+    if widget.get_realized():
+        on_realize(widget)
+    else:
+        handler["realize"] = widget.connect("realize", on_realize)
+
+
+def trace_first_frame(window, application):
+    """
+    Report the time to first frame of window if TABS_STARTUP_TIMING is set.
+
+    Args:
+        window (Gtk.Window): The main window, before it is presented.
+        application (Gtk.Application): Quit when timing mode is "exit".
+    """
+    mode = os.environ.get(TIMING_ENV)
+    if not mode:
+        return
+
+    try:
+        budget_ms = float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MS))
+    except ValueError:
+        budget_ms = DEFAULT_BUDGET_MS
+
+    handler = {}
+
+    def quit_application():
+        application.quit()
+        return GLib.SOURCE_REMOVE
+
+    # Measured at paint time, not when the idle callback runs
+    def on_after_paint(clock):
+        clock.disconnect(handler.pop("id"))
+        elapsed_ms = (time.monotonic() - START_TIME) * 1000
+        over_budget = elapsed_ms > budget_ms
+        status = "OVER BUDGET" if over_budget else "ok"
+        print(f"Time to first frame: {elapsed_ms:.0f} ms (budget {budget_ms:.0f} ms, {status})")
+        if mode == "exit":
+            application.startup_over_budget = over_budget
+            GLib.idle_add(quit_application)
+
+    def on_realize(window):
+        window.disconnect(handler.pop("realize"))
+        handler["id"] = window.get_frame_clock().connect("after-paint", on_after_paint)
+
+    handler["realize"] = window.connect("realize", on_realize)
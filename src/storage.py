@@ -0,0 +1,640 @@
+# storage.py
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+from .cache import LRUCache
+
+
+class TabsStore:
+    """
+    SQLite store for cached songs, cached searches and favorites.
+
+    Entries are written one by one as they are fetched and song bodies are
+    only read when a song is opened, so opening and closing the store does
+    not depend on how many songs are cached. Tab bodies are stored
+    zlib-compressed and the song cache is bounded by compressed size.
+    Songs of favorites are pinned: they never count against that budget
+    and are never evicted. Title, artist and tab text are indexed with
+    SQLite FTS5 (when available) so cached songs can be searched offline.
+    Per-song settings (autoscroll) live in their own table, so downloading
+    a song again keeps them and changing them doesn't rewrite the song.
+    Every method is thread-safe. Writes go through one connection, one at
+    a time; reads use a connection per thread, so with WAL they never wait
+    for a write (such as a song being compressed and indexed) to finish.
+    """
+    SCHEMA_VERSION = 5
+    COMPRESSION_LEVEL = 9
+    # Relevance weights of the indexed columns (title, artist, body) for bm25()
+    TEXT_INDEX_WEIGHTS = (10.0, 5.0, 1.0)
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.has_text_index = False
+        self._create_schema()
+        # Read-only connections, one per reading thread
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+    def _create_schema(self):
+        """Create the tables if they don't exist yet."""
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version == 1:
+                self._upgrade_compressed_songs()
+                version = 2
+            if version == 2:
+                self._upgrade_pinned_songs()
+                version = 3
+            if version == 3:
+                self._upgrade_search_freshness()
+                version = 4
+            if version == 4:
+                self._upgrade_song_settings()
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS songs (
+                    url TEXT PRIMARY KEY,
+                    meta TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL,
+                    last_used REAL NOT NULL,
+                    fetched_at REAL NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS songs_last_used ON songs(last_used);
+
+                CREATE TABLE IF NOT EXISTS pinned (
+                    url TEXT PRIMARY KEY
+                );
+
+                CREATE TABLE IF NOT EXISTS song_settings (
+                    url TEXT PRIMARY KEY,
+                    autoscroll TEXT NOT NULL
+                );
+
+                CREATE TABLE IF NOT EXISTS searches (
+                    query TEXT PRIMARY KEY,
+                    results TEXT NOT NULL,
+                    last_used REAL NOT NULL,
+                    fetched_at REAL NOT NULL DEFAULT 0,
+                    validators TEXT
+                );
+                CREATE INDEX IF NOT EXISTS searches_last_used ON searches(last_used);
+
+                CREATE TABLE IF NOT EXISTS favorites (
+                    position INTEGER PRIMARY KEY,
+                    data TEXT NOT NULL
+                );
+            """)
+            self._create_text_index()
+
+    def _create_text_index(self):
+        """Create the full-text index of songs and fill it from stored songs. Lock must be held."""
+        exists = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'songs_fts'"
+        ).fetchone()
+        if exists:
+            self.has_text_index = True
+            return
+        self._conn.execute("BEGIN")
+        try:
+            # Index rows share the rowid of their song; the text itself lives in songs
+            self._conn.execute("""
+                CREATE VIRTUAL TABLE songs_fts USING fts5(
+                    title, artist, body,
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+            self._conn.execute("""
+                CREATE TRIGGER songs_fts_delete AFTER DELETE ON songs BEGIN
+                    DELETE FROM songs_fts WHERE rowid = old.rowid;
+                END
+            """)
+            rows = self._conn.execute("SELECT rowid, meta, body FROM songs").fetchall()
+            for rowid, meta, body in rows:
+                self._index_song(rowid, json.loads(meta), zlib.decompress(body).decode("utf-8"))
+        except sqlite3.OperationalError as e:
+            # SQLite built without FTS5: searches fall back to titles and artists
+            self._conn.execute("ROLLBACK")
+            print(f"Full-text index unavailable: {e}")
+            return
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self.has_text_index = True
+        if rows:
+            print(f"Indexed {len(rows)} cached songs")
+
+    def _index_song(self, rowid, meta, tab_content):
+        """Add a song to the full-text index. Lock must be held."""
+        self._conn.execute(
+            "INSERT INTO songs_fts (rowid, title, artist, body) VALUES (?, ?, ?, ?)",
+            (rowid, meta.get("title", ""), meta.get("artist", ""), tab_content)
+        )
+
+    def _upgrade_compressed_songs(self):
+        """Convert a version 1 songs table (plain text bodies) to compressed bodies. Lock must be held."""
+        rows = self._conn.execute("SELECT url, meta, tab_content, last_used FROM songs").fetchall()
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("ALTER TABLE songs RENAME TO songs_v1")
+            self._conn.execute("DROP INDEX IF EXISTS songs_last_used")
+            self._conn.execute("""
+                CREATE TABLE songs (
+                    url TEXT PRIMARY KEY,
+                    meta TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    stored_size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            for url, meta, tab_content, last_used in rows:
+                self._conn.execute(
+                    "INSERT INTO songs (url, meta, body, raw_size, stored_size, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                    (url, meta, *self._compress(tab_content), last_used)
+                )
+            self._conn.execute("DROP TABLE songs_v1")
+            self._conn.execute("PRAGMA user_version = 2")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _upgrade_pinned_songs(self):
+        """Add download times and pin the songs of existing favorites (version 2 to 3). Lock must be held."""
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("ALTER TABLE songs ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE songs SET fetched_at = last_used")
+            self._conn.execute("CREATE TABLE pinned (url TEXT PRIMARY KEY)")
+            favorites = [
+                json.loads(row[0]) for row in
+                self._conn.execute("SELECT data FROM favorites").fetchall()
+            ]
+            self._replace_pinned(favorites)
+            self._conn.execute("PRAGMA user_version = 3")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _upgrade_search_freshness(self):
+        """Add download times and HTTP validators to cached searches (version 3 to 4). Lock must be held."""
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("ALTER TABLE searches ADD COLUMN fetched_at REAL NOT NULL DEFAULT 0")
+            self._conn.execute("ALTER TABLE searches ADD COLUMN validators TEXT")
+            self._conn.execute("UPDATE searches SET fetched_at = last_used")
+            self._conn.execute("PRAGMA user_version = 4")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _upgrade_song_settings(self):
+        """Move autoscroll settings out of the song metadata (version 4 to 5). Lock must be held."""
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("CREATE TABLE song_settings (url TEXT PRIMARY KEY, autoscroll TEXT NOT NULL)")
+            rows = self._conn.execute(
+                "SELECT url, meta FROM songs WHERE meta LIKE '%\"autoscroll\"%'"
+            ).fetchall()
+            for url, meta in rows:
+                meta = json.loads(meta)
+                autoscroll = meta.pop("autoscroll", None)
+                if autoscroll is None:
+                    continue
+                self._conn.execute(
+                    "INSERT INTO song_settings (url, autoscroll) VALUES (?, ?)",
+                    (url, json.dumps(autoscroll))
+                )
+                self._conn.execute(
+                    "UPDATE songs SET meta = ? WHERE url = ?", (json.dumps(meta), url)
+                )
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @classmethod
+    def _compress(cls, tab_content):
+        """
+        Compress a tab body.
+
+        Returns:
+            tuple: (compressed bytes, uncompressed size, compressed size)
+        """
+        raw = tab_content.encode("utf-8")
+        body = zlib.compress(raw, cls.COMPRESSION_LEVEL)
+        return body, len(raw), len(body)
+
+    def _reader(self):
+        """Return the read-only connection of the calling thread, opened on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self):
+        """Close the database connections."""
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        with self._lock:
+            self._conn.close()
+
+    # -----------------------
+    # SONGS
+    # -----------------------
+    def get_song(self, url):
+        """
+        Load a cached song (see touch_song() to mark it as recently used).
+
+        Args:
+            url (str): Song URL used as cache key.
+
+        Returns:
+            dict: Song details (as returned by get_song_details, plus
+            "fetched_at" with the download time and "autoscroll" if the
+            song has settings), or None.
+        """
+        row = self._reader().execute(
+            "SELECT songs.meta, songs.body, songs.fetched_at, song_settings.autoscroll "
+            "FROM songs LEFT JOIN song_settings ON song_settings.url = songs.url "
+            "WHERE songs.url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        song_data = json.loads(row[0])
+        song_data["tab_content"] = zlib.decompress(row[1]).decode("utf-8")
+        song_data["fetched_at"] = row[2]
+        if row[3] is not None:
+            song_data["autoscroll"] = json.loads(row[3])
+        return song_data
+
+    def touch_song(self, url):
+        """Mark a cached song as recently used (kept longest within the budget)."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE songs SET last_used = ? WHERE url = ?", (time.time(), url)
+            )
+
+    def has_song(self, url):
+        """Return True if a song is cached, without loading it."""
+        return self._reader().execute(
+            "SELECT 1 FROM songs WHERE url = ?", (url,)
+        ).fetchone() is not None
+
+    def put_song(self, url, song_data, max_bytes=None):
+        """
+        Insert or replace a cached song.
+
+        Args:
+            url (str): Song URL used as cache key.
+            song_data (dict): Song details (as returned by get_song_details).
+                Its "fetched_at" time is kept if present, otherwise it is now.
+                Its settings are ignored: see put_song_settings().
+            max_bytes (int): If given, evict least recently used songs until
+                the compressed bodies fit in this budget.
+        """
+        meta = self._song_meta(song_data)
+        compressed = self._compress(song_data.get("tab_content", ""))
+        now = time.time()
+        with self._lock:
+            # Deleted first so the trigger also drops the old index row
+            self._conn.execute("DELETE FROM songs WHERE url = ?", (url,))
+            cursor = self._conn.execute(
+                "INSERT INTO songs (url, meta, body, raw_size, stored_size, last_used, fetched_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, json.dumps(meta), *compressed, now, song_data.get("fetched_at", now))
+            )
+            if self.has_text_index:
+                self._index_song(cursor.lastrowid, meta, song_data.get("tab_content", ""))
+            if max_bytes is not None:
+                self._prune_songs_to_budget(max_bytes)
+
+    def refresh_song(self, url, song_data):
+        """Record that a cached song was revalidated unchanged, without rewriting its body."""
+        meta = self._song_meta(song_data)
+        with self._lock:
+            self._conn.execute(
+                "UPDATE songs SET meta = ?, fetched_at = ? WHERE url = ?",
+                (json.dumps(meta), song_data.get("fetched_at", time.time()), url)
+            )
+
+    def put_song_settings(self, url, autoscroll):
+        """Store the autoscroll settings of a song; kept when the song is downloaded again."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO song_settings (url, autoscroll) VALUES (?, ?)",
+                (url, json.dumps(autoscroll))
+            )
+
+    @staticmethod
+    def _song_meta(song_data):
+        """Return the song details stored as metadata: no body, time or settings."""
+        return {
+            k: v for k, v in song_data.items()
+            if k not in ("tab_content", "fetched_at", "autoscroll")
+        }
+
+    def _prune_songs_to_budget(self, max_bytes):
+        """Delete the least recently used unpinned songs beyond max_bytes of compressed bodies. Lock must be held."""
+        self._conn.execute("""
+            DELETE FROM songs WHERE rowid IN (
+                SELECT rowid FROM (
+                    SELECT rowid, SUM(stored_size) OVER (ORDER BY last_used DESC, rowid DESC) AS total
+                    FROM songs WHERE url NOT IN (SELECT url FROM pinned)
+                ) WHERE total > ?
+            )
+        """, (max_bytes,))
+
+    def search_songs(self, query, limit=20):
+        """
+        Search cached songs by title, artist and tab text.
+
+        Every word of the query must match; the last one may be a prefix,
+        so results already show up while a word is being typed.
+
+        Args:
+            query (str): Words to look for.
+            limit (int): Maximum number of results.
+
+        Returns:
+            list: Result dictionaries shaped like search results (song_url,
+            song, artist, type), best match first, marked with "offline".
+        """
+        words = re.findall(r"\w+", query.lower())
+        if not words:
+            return []
+        if self.has_text_index:
+            match = " ".join(f'"{word}"' for word in words) + "*"
+            rows = self._reader().execute(
+                "SELECT songs.url, songs.meta FROM songs_fts JOIN songs ON songs.rowid = songs_fts.rowid "
+                "WHERE songs_fts MATCH ? ORDER BY bm25(songs_fts, ?, ?, ?) LIMIT ?",
+                (match, *self.TEXT_INDEX_WEIGHTS, limit)
+            ).fetchall()
+        else:
+            # Bodies are compressed: only titles and artists (in meta) are searched
+            rows = self._reader().execute(
+                "SELECT url, meta FROM songs WHERE "
+                + " AND ".join("meta LIKE ?" for _ in words)
+                + " ORDER BY last_used DESC LIMIT ?",
+                (*(f"%{word}%" for word in words), limit)
+            ).fetchall()
+        results = []
+        for url, meta in rows:
+            meta = json.loads(meta)
+            results.append({
+                "song_url": url,
+                "song": meta.get("title", "N/A"),
+                "artist": meta.get("artist", "N/A"),
+                "type": meta.get("type", "N/A"),
+                "offline": True,
+            })
+        return results
+
+    def song_titles(self):
+        """Return (title, artist) of every cached song, most recently used first."""
+        rows = self._reader().execute(
+            "SELECT meta FROM songs ORDER BY last_used DESC"
+        ).fetchall()
+        titles = []
+        for (meta,) in rows:
+            meta = json.loads(meta)
+            titles.append((meta.get("title", ""), meta.get("artist", "")))
+        return titles
+
+    def stale_songs(self, urls, max_age):
+        """
+        Select the songs that need to be downloaded again.
+
+        Args:
+            urls (list): Song URLs to check.
+            max_age (float): Seconds after which a stored song is outdated.
+
+        Returns:
+            list: URLs (in the given order) that are not stored or are outdated.
+        """
+        cutoff = time.time() - max_age
+        fresh = set()
+        conn = self._reader()
+        # Stay well below SQLite's limit on bound parameters
+        for i in range(0, len(urls), 500):
+            batch = urls[i:i + 500]
+            rows = conn.execute(
+                f"SELECT url FROM songs WHERE fetched_at >= ? AND url IN ({', '.join('?' * len(batch))})",
+                (cutoff, *batch)
+            ).fetchall()
+            fresh.update(row[0] for row in rows)
+        return [url for url in urls if url not in fresh]
+
+    def stats(self):
+        """
+        Report the song cache footprint.
+
+        Returns:
+            dict: Number of songs, uncompressed and compressed body sizes,
+            compression ratio and size of the database file, in bytes.
+        """
+        conn = self._reader()
+        count, raw_bytes, stored_bytes = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM songs"
+        ).fetchone()
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "songs": count,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "ratio": raw_bytes / stored_bytes if stored_bytes else 0.0,
+            "file_bytes": page_count * page_size,
+        }
+
+    # -----------------------
+    # SEARCHES
+    # -----------------------
+    def get_search(self, query):
+        """Return the cached result list of a search, or None (see touch_search())."""
+        row = self._reader().execute(
+            "SELECT results FROM searches WHERE query = ?", (query,)
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def touch_search(self, query):
+        """Mark a cached search as recently used."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE searches SET last_used = ? WHERE query = ?", (time.time(), query)
+            )
+
+    def get_search_freshness(self, query):
+        """
+        Return when a search was fetched and the HTTP validators of its page.
+
+        Returns:
+            tuple: (fetched_at timestamp, validators dict or None), or None if not cached.
+        """
+        row = self._reader().execute(
+            "SELECT fetched_at, validators FROM searches WHERE query = ?", (query,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1]) if row[1] else None
+
+    def put_search(self, query, songs, max_searches=None, validators=None):
+        """Insert or replace a cached search, then evict the least recently used beyond max_searches."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO searches (query, results, last_used, fetched_at, validators) VALUES (?, ?, ?, ?, ?)",
+                (query, json.dumps(songs), now, now, json.dumps(validators) if validators else None)
+            )
+            if max_searches is not None:
+                self._prune("searches", max_searches)
+
+    def refresh_search(self, query, validators):
+        """Record that a cached search was revalidated unchanged."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE searches SET fetched_at = ?, validators = ? WHERE query = ?",
+                (time.time(), json.dumps(validators) if validators else None, query)
+            )
+
+    def search_queries(self):
+        """Return the cached search queries, most recently used first."""
+        rows = self._reader().execute(
+            "SELECT query FROM searches ORDER BY last_used DESC"
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def _prune(self, table, max_rows):
+        """Delete the least recently used rows of a table beyond max_rows. Lock must be held."""
+        self._conn.execute(
+            f"DELETE FROM {table} WHERE rowid IN ("
+            f"SELECT rowid FROM {table} ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (max_rows,)
+        )
+
+    # -----------------------
+    # FAVORITES
+    # -----------------------
+    def load_favorites(self):
+        """Return the favorites list in display order."""
+        rows = self._reader().execute(
+            "SELECT data FROM favorites ORDER BY position"
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def save_favorites(self, favorites):
+        """Replace the stored favorites with the given list."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.execute("DELETE FROM favorites")
+                self._conn.executemany(
+                    "INSERT INTO favorites (position, data) VALUES (?, ?)",
+                    [(i, json.dumps(song)) for i, song in enumerate(favorites)]
+                )
+                self._replace_pinned(favorites)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _replace_pinned(self, favorites):
+        """Pin exactly the songs of the given favorites. Lock must be held."""
+        self._conn.execute("DELETE FROM pinned")
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO pinned (url) VALUES (?)",
+            [(song["song_url"],) for song in favorites if song.get("song_url")]
+        )
+
+    # -----------------------
+    # MIGRATION
+    # -----------------------
+    def migrate_from_json(self, cache_file, config_file):
+        """
+        Import cache.json songs/searches and config.json favorites on first run.
+
+        The import runs once (tracked with PRAGMA user_version). cache.json is
+        deleted afterwards; config.json is left for the remaining settings.
+        """
+        with self._lock:
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        songs, searches, favorites = [], [], []
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r') as f:
+                    cache = json.load(f)
+                songs = LRUCache.from_list(cache.get("cached_songs"), len(cache.get("cached_songs") or [])).to_list()
+                searches = LRUCache.from_list(cache.get("cached_searches"), len(cache.get("cached_searches") or [])).to_list()
+            except (IOError, json.JSONDecodeError, ValueError, TypeError) as e:
+                print(f"Error loading cache for migration: {e}")
+        if os.path.exists(config_file):
+            try:
+                with open(config_file, 'r') as f:
+                    favorites = json.load(f).get("favorites") or []
+            except (IOError, json.JSONDecodeError, ValueError) as e:
+                print(f"Error loading config for migration: {e}")
+
+        # Keep the old order as recency: oldest entries get the smallest timestamps
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for i, (url, song_data) in enumerate(songs):
+                    meta = {k: v for k, v in song_data.items() if k != "tab_content"}
+                    self._conn.execute("DELETE FROM songs WHERE url = ?", (url,))
+                    cursor = self._conn.execute(
+                        "INSERT INTO songs (url, meta, body, raw_size, stored_size, last_used) VALUES (?, ?, ?, ?, ?, ?)",
+                        (url, json.dumps(meta), *self._compress(song_data.get("tab_content", "")), now - len(songs) + i)
+                    )
+                    if self.has_text_index:
+                        self._index_song(cursor.lastrowid, meta, song_data.get("tab_content", ""))
+                for i, (query, results) in enumerate(searches):
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO searches (query, results, last_used) VALUES (?, ?, ?)",
+                        (query, json.dumps(results), now - len(searches) + i)
+                    )
+                if favorites:
+                    self._conn.execute("DELETE FROM favorites")
+                    self._conn.executemany(
+                        "INSERT INTO favorites (position, data) VALUES (?, ?)",
+                        [(i, json.dumps(song)) for i, song in enumerate(favorites)]
+                    )
+                    self._replace_pinned(favorites)
+                self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+        print(f"Migrated {len(songs)} songs, {len(searches)} searches and {len(favorites)} favorites")
+        if os.path.exists(cache_file):
+            try:
+                os.remove(cache_file)
+            except OSError as e:
+                print(f"Could not remove migrated cache file: {e}")
@@ -0,0 +1,90 @@
+# suggest.py
+import heapq
+import unicodedata
+
+# Key of the entry stored at the node where a text ends (never a character)
+_END = ""
+
+
+def canonical_query(text):
+    """
+    Normalize a query so equivalent spellings share cache entries.
+
+    Applies Unicode NFKC normalization, case folding and whitespace
+    collapsing: "Wonderwall", "wonderwall " and "WONDERWALL" are equal.
+
+    Args:
+        text (str): Query as typed.
+
+    Returns:
+        str: Canonical form of the query ("" if it is blank).
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class PrefixTrie:
+    """
+    Character trie mapping canonical texts to suggestions.
+
+    Each text has a display form (as it should appear in the search entry)
+    and a weight; adding the same text again adds to its weight, so
+    frequent queries rise to the top. Not thread-safe.
+    """
+    def __init__(self):
+        self._root = {}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def add(self, text, weight=1.0):
+        """
+        Add a suggestion, or increase its weight if it is already known.
+
+        Args:
+            text (str): Suggestion as it should be displayed.
+            weight (float): Relevance added to the suggestion.
+        """
+        key = canonical_query(text)
+        if not key:
+            return
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        entry = node.get(_END)
+        if entry is None:
+            self._size += 1
+            node[_END] = (" ".join(text.split()), weight)
+        else:
+            node[_END] = (entry[0], entry[1] + weight)
+
+    def complete(self, prefix, limit=8):
+        """
+        Return the best suggestions starting with a prefix.
+
+        Args:
+            prefix (str): Text typed so far (canonicalized before lookup).
+            limit (int): Maximum number of suggestions.
+
+        Returns:
+            list: Display texts, highest weight first.
+        """
+        node = self._root
+        for char in canonical_query(prefix):
+            node = node.get(char)
+            if node is None:
+                return []
+        best = heapq.nlargest(limit, self._entries(node), key=lambda entry: entry[1])
+        return [display for display, _ in best]
+
+    @staticmethod
+    def _entries(node):
+        """Yield every (display, weight) entry below a node."""
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            for char, child in node.items():
+                if char == _END:
+                    yield child
+                else:
+                    stack.append(child)
@@ -0,0 +1,58 @@
+# sync.py
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def download_songs(urls, fetch, on_song, on_progress=None, max_parallel=8,
+                   retries=3, backoff=0.5, should_stop=None):
+    """
+    Download many songs in parallel. Blocking: run it on a worker thread.
+
+    Failed downloads are retried with exponential backoff and jitter, so a
+    few transient errors don't leave holes in a large batch.
+
+    Args:
+        urls (list): Song URLs to download.
+        fetch (callable): url -> song dictionary ({} on error).
+        on_song (callable): Called with (url, song_data) for each download, from a pool thread.
+        on_progress (callable): Called with (done, total, failed) after each song, from a pool thread.
+        max_parallel (int): Maximum number of downloads at once.
+        retries (int): Extra attempts for a failed download.
+        backoff (float): Delay before the first retry in seconds, doubled each time.
+        should_stop (callable): Returns True to abandon the remaining downloads.
+
+    Returns:
+        list: URLs that could not be downloaded.
+    """
+    def stopped():
+        return should_stop is not None and should_stop()
+
+    def download(url):
+        for attempt in range(retries + 1):
+            if stopped():
+                return False
+            song_data = fetch(url)
+            if song_data:
+                on_song(url, song_data)
+                return True
+            if attempt < retries:
+                time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+        return False
+
+    failed = []
+    if not urls:
+        return failed
+
+    with ThreadPoolExecutor(max_workers=max_parallel, thread_name_prefix="tabs-sync") as executor:
+        futures = {executor.submit(download, url): url for url in urls}
+        for done, future in enumerate(as_completed(futures), 1):
+            if future.exception() is not None or not future.result():
+                failed.append(futures[future])
+            if on_progress is not None:
+                on_progress(done, len(urls), len(failed))
+            if stopped():
+                for pending in futures:
+                    pending.cancel()
+                break
+    return failed
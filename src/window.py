@@ -2,15 +2,80 @@
 import gi
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
-import json, os, re
-from gi.repository import Gtk, Adw, Pango, Gdk, GLib
+import json, os, threading, time
+import urllib.error
+from gi.repository import Gtk, Adw, Pango, Gdk, GLib, Gio, Graphene
 # Assuming .scraper is correctly implemented
-from .scraper import fetch_freetar_results, get_song_details
+from .scraper import (
+    iter_freetar_pages, fetch_freetar_results_if_modified, get_song_details_if_modified,
+    inflight
+)
+from .worker import BackgroundWorker
+from .cache import LRUCache
+from .storage import TabsStore
+from .persistence import PersistenceWriter, atomic_write_json
+from .startup import after_first_frame
+from .songlist import SongItem, new_song_model, new_song_factory
+from .chords import compute_chord_spans
+from .sections import compute_line_index, song_duration
+from .prefetch import SongPrefetcher
+from .sync import download_songs
+from .suggest import PrefixTrie, canonical_query
+from .mirrors import mirrors
+from .animation import FrameAnimator
+from .zoompreview import ZoomPreview
 
 # Define the maximum size of the history stack
 MAX_HISTORY_SIZE = 10
-MAX_CACHED_SONGS = 1000
 MAX_CACHED_SEARCHES = 1000
+# Default disk budget for compressed tab bodies ("song_cache_budget" in config.json)
+DEFAULT_SONG_CACHE_BUDGET = 32 * 1024 * 1024
+# Entries kept in memory; the rest stays in the database until needed
+MAX_LOADED_SONGS = 50
+MAX_LOADED_SONG_BYTES = 2 * 1024 * 1024
+MAX_LOADED_SEARCHES = 100
+# Results pages fetched per search: the first is streamed, the others are
+# fetched concurrently once it tells how many there are. Searches made while
+# typing only fetch the first page until they are confirmed.
+MAX_SEARCH_PAGES = 3
+# Search results whose song pages are fetched before they are opened
+PREFETCH_TOP_RESULTS = 5
+# Cached entries older than this are shown at once, then revalidated in the
+# background ("song_ttl" / "search_ttl" in config.json, in seconds). Offline
+# syncs also refresh favorites older than the song TTL.
+DEFAULT_SONG_TTL = 7 * 24 * 3600
+DEFAULT_SEARCH_TTL = 24 * 3600
+FAVORITES_SYNC_PARALLEL = 8
+# Searching while typing: network searches wait for a pause in typing
+TYPED_SEARCH_DELAY_MS = 600
+MIN_TYPED_QUERY_LENGTH = 3
+MAX_SUGGESTIONS = 8
+# Suggestion weights: past queries rank above favorites, then cached songs
+QUERY_SUGGESTION_WEIGHT = 3.0
+FAVORITE_SUGGESTION_WEIGHT = 2.0
+SONG_SUGGESTION_WEIGHT = 1.0
+# Chords tagged before the first frame of a song; the rest follow in idle chunks
+CHORD_SPANS_FIRST_CHUNK = 400
+CHORD_SPANS_IDLE_CHUNK = 1000
+# Tab lines inserted before the first frame (about a screenful); long tabs
+# are appended in idle chunks so opening them takes the same time as short ones
+LYRICS_FIRST_CHUNK_LINES = 150
+LYRICS_IDLE_CHUNK_LINES = 300
+# Fully tagged text buffers kept for instant revisits, bounded by count and
+# by an estimate of their memory (text, B-tree, tags and line layout)
+MAX_RENDERED_BUFFERS = 8
+MAX_RENDERED_BUFFER_BYTES = 8 * 1024 * 1024
+RENDERED_BUFFER_BYTES_PER_CHAR = 8
+
+
+def _positive_setting(config, key, default):
+    """Return a positive number from config.json, or the default if missing or invalid."""
+    value = config.get(key, default)
+    # bool is an int subclass, but "true" is no size or duration
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not 0 < value < float("inf"):
+        print(f"Invalid {key} in config: {value!r}, using {default}")
+        return default
+    return value
 
 @Gtk.Template(resource_path='/org/clero/tabs/window.ui')
 class TabsWindow(Adw.ApplicationWindow):
@@ -33,11 +98,20 @@ class TabsWindow(Adw.ApplicationWindow):
     favorites_button = Gtk.Template.Child()
     fav_song_button = Gtk.Template.Child()
     fav_icon = Gtk.Template.Child()
+    loading_spinner = Gtk.Template.Child()
+    sync_progress = Gtk.Template.Child()
 
     play_pause_button = Gtk.Template.Child()
     speed_scale = Gtk.Template.Child()
     chords_scrolled_window = Gtk.Template.Child()
     controls_box = Gtk.Template.Child()
+    sections_button = Gtk.Template.Child()
+    sections_list = Gtk.Template.Child()
+    scroll_mode_speed = Gtk.Template.Child()
+    scroll_mode_duration = Gtk.Template.Child()
+    scroll_mode_tempo = Gtk.Template.Child()
+    duration_spin = Gtk.Template.Child()
+    bpm_spin = Gtk.Template.Child()
 
     # ADW Leaflet bindings
     leaflet = Gtk.Template.Child()
@@ -52,17 +126,62 @@ class TabsWindow(Adw.ApplicationWindow):
         self.stack.set_transition_duration(400)
         # Connect to leaflet to manage control visibility
         self.leaflet.connect("notify::visible-child", self.on_leaflet_visible_child_changed)
+        self.stack.connect("notify::visible-child", lambda *args: self.suggestions_popover.popdown())
+
+        # ========== BACKGROUND WORKER ==========
+        # Network fetches run off the main loop; results come back via GLib.idle_add
+        self.worker = BackgroundWorker(on_busy_changed=self.on_worker_busy_changed)
+        self._pending_search = None
+        # Queries searched while typing and not confirmed yet -> page count.
+        # They stay out of the stored history and suggestions until confirmed.
+        self._unconfirmed_searches = {}
 
         # ========== SEARCH CONNECTIONS ==========
         self.search_entry.connect("activate", self.on_search_activated)
-        self.results_list.connect("row-activated", self.on_row_activated)
-        self.favorites_list.connect("row-activated", self.on_row_activated)
+        self.search_entry.connect("search-changed", self.on_search_changed)
+        self._typed_search_id = None
+        # Query set from a suggestion or confirmed with Enter: its change
+        # notification must not bring the suggestions back
+        self._confirmed_query = None
+        # Completions of the typed text; the entry keeps the keyboard focus
+        self.suggestions = PrefixTrie()
+        self.suggestions_list = Gtk.ListBox(selection_mode=Gtk.SelectionMode.NONE)
+        self.suggestions_list.set_activate_on_single_click(True)
+        self.suggestions_list.set_can_focus(False)
+        self.suggestions_list.connect("row-activated", self.on_suggestion_activated)
+        self.suggestions_popover = Gtk.Popover(
+            child=self.suggestions_list, autohide=False, has_arrow=False,
+            position=Gtk.PositionType.BOTTOM
+        )
+        self.suggestions_popover.set_parent(self.search_entry)
+        # autohide is off (it would grab the focus): close it when the entry loses it
+        focus_controller = Gtk.EventControllerFocus.new()
+        focus_controller.connect("leave", lambda controller: self.suggestions_popover.popdown())
+        self.search_entry.add_controller(focus_controller)
+        # Model-backed lists: only visible rows are realized, and recycled
+        self.results_list.set_factory(new_song_factory(on_hover=self.on_song_hovered))
+        self.results_list.set_model(new_song_model())
+        self.favorites_list.set_factory(new_song_factory(on_hover=self.on_song_hovered))
+        self.results_list.connect("activate", self.on_row_activated)
+        self.favorites_list.connect("activate", self.on_row_activated)
 
         # ========== SCROLL / PLAYBACK MANAGEMENT ==========
-        self.scroll_timeout_id = None
+        # Autoscroll and the controls fade run on the frame clock, only while active
+        self.animator = FrameAnimator(self)
         self.scroll_speed = 1.0       # Base scroll speed
-        self.scroll_interval = 50     # Update interval in ms
-        self.scroll_amount = 0.5      # Base pixels to scroll per interval
+        self.scroll_rate = 10.0       # Pixels per second at speed 1
+        # Timing of the song shown ("speed", "duration" or "tempo"), saved with it
+        self.scroll_settings = {"mode": "speed"}
+        self._scroll_duration = None  # Seconds for the whole song, None for free speed
+        self.current_song_url = None
+        self.current_song_data = None
+        self.current_line_index = compute_line_index("")
+        self._loading_scroll_settings = False
+        for button in (self.scroll_mode_speed, self.scroll_mode_duration, self.scroll_mode_tempo):
+            button.connect("toggled", self.on_scroll_mode_toggled)
+        self.duration_spin.connect("value-changed", self.on_scroll_timing_changed)
+        self.bpm_spin.connect("value-changed", self.on_scroll_timing_changed)
+        self.sections_list.connect("row-activated", self.on_section_activated)
 
         # Connect playback controls
         if self.play_pause_button:
@@ -76,8 +195,6 @@ class TabsWindow(Adw.ApplicationWindow):
             self.speed_scale.set_visible(False)  # Hidden by default
 
         # ========== CONFIGURATION FILE ==========
-        self.favorites = None
-
         # Define configuration file path
         self.config_dir = os.environ.get("XDG_CONFIG_HOME")
         self.config_file = os.path.join(self.config_dir, "config.json")
@@ -85,6 +202,9 @@ class TabsWindow(Adw.ApplicationWindow):
         # Set default zoom
         default_zoom = 10.0
         initial_zoom = default_zoom
+        self.song_cache_budget = DEFAULT_SONG_CACHE_BUDGET
+        self.song_ttl = DEFAULT_SONG_TTL
+        self.search_ttl = DEFAULT_SEARCH_TTL
 
         # Load configuration from file
         if os.path.exists(self.config_file):
@@ -94,41 +214,114 @@ class TabsWindow(Adw.ApplicationWindow):
                     loaded_size = float(config.get("zoom_size", default_zoom))
                     # Clamp zoom size between 6.0 and 36.0
                     initial_zoom = max(6.0, min(loaded_size, 36.0))
-                    self.favorites = config.get("favorites")
-            except (IOError, json.JSONDecodeError, ValueError) as e:
+                    # Invalid values (null, lists, negative...) fall back to the defaults
+                    self.song_cache_budget = int(_positive_setting(
+                        config, "song_cache_budget", DEFAULT_SONG_CACHE_BUDGET
+                    ))
+                    self.song_ttl = _positive_setting(config, "song_ttl", DEFAULT_SONG_TTL)
+                    self.search_ttl = _positive_setting(config, "search_ttl", DEFAULT_SEARCH_TTL)
+                    # Freetar instances to use, e.g. ["https://freetar.example/"]
+                    if isinstance(config.get("mirrors"), list) and config["mirrors"]:
+                        mirrors.set_mirrors(config["mirrors"])
+            except (IOError, json.JSONDecodeError, ValueError, TypeError, AttributeError) as e:
                 print(f"Error loading config: {e}")
         else:
             print("No config file found")
 
-        # ========== CACHE FILE ==========
-        self.cached_songs = None
-        self.cached_searches = None
-
-        # Define cache file path
+        # ========== DATABASE ==========
+        # Songs, searches and favorites are stored in SQLite. The database is
+        # opened by the writer thread so the window can show up first.
+        self.data_dir = os.environ.get("XDG_DATA_HOME")
         self.cache_dir = os.environ.get("XDG_CACHE_HOME")
         self.cache_file = os.path.join(self.cache_dir, "cache.json")
+        self.store = None
+        self.favorites = []
+        self._favorites_loaded = False
+
+        # Saves happen in the background shortly after each change
+        self.writer = PersistenceWriter()
+        self._shut_down = False
+        self.writer.submit(self._open_store)
+
+        # Recently used entries stay in memory, others are loaded on demand
+        self.cached_songs = LRUCache(
+            MAX_LOADED_SONGS,
+            max_bytes=MAX_LOADED_SONG_BYTES,
+            sizeof=lambda song_data: len(song_data.get("tab_content", ""))
+        )
+        self.cached_searches = LRUCache(MAX_LOADED_SEARCHES)
 
-        # Load cache from file
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cache = json.load(f)
-                    self.cached_songs = cache.get("cached_songs")
-                    self.cached_searches = cache.get("cached_searches")
-            except (IOError, json.JSONDecodeError, ValueError) as e:
-                print(f"Error loading cache: {e}")
-        else:
-            print("No cache file found")
-
-        if not self.cached_songs:
-            self.cached_songs = []
-        if not self.cached_searches:
-            self.cached_searches = []
+        # Likely next songs are fetched ahead of time into the caches above
+        self.prefetcher = SongPrefetcher(
+            self._fetch_song_page, self._on_song_prefetched, self._is_song_cached
+        )
 
         # ========== ZOOM MECHANISMS ==========
         self._current_zoom_size = initial_zoom
         self._pinch_start_size = initial_zoom
+        # Size the CSS was last generated for; changes are applied at most once per frame
+        self._applied_zoom_size = None
+
+        # Connect window close handler to save settings
+        self.connect("close-request", self.on_close_request)
+
+        # ========== FAVORITES ==========
+        # The model is filled once the database is open, then kept in sync
+        favorites_model = new_song_model()
+        self.favorites_store = favorites_model.get_model()
+        self.favorites_list.set_model(favorites_model)
+        self.songs_searched = self.favorites
+
+        # Connect favorite button on song page
+        self.fav_song_button.connect("clicked", self.on_fav_song_clicked)
+
+        # Offline sync of every favorite song (set to stop it at shutdown)
+        self._sync_stop = threading.Event()
+        sync_action = Gio.SimpleAction.new("sync-favorites", None)
+        sync_action.connect("activate", self.on_sync_favorites)
+        self.add_action(sync_action)
+
+        # ============ HISTORY MANAGEMENT ============
+        # History stack (list of states, limited to MAX_HISTORY_SIZE)
+        self.history = []
+        # Initialize history with the starting state
+        self._push_history(["favorites"])
+        self.back_button.connect("clicked", self.on_back_clicked)
+        self.favorites_button.connect("clicked", self.on_favorites_clicked)
+
+        # ========== OPACITY ANIMATION ==========
+        self.is_mouse_over_controls = False
+        self.current_opacity = 1.0  # Start at full opacity
+        self.target_opacity = 1.0
+        self.animation_speed = 0.1  # Fraction of the distance covered per 60 Hz frame
 
+        # Initial opacity
+        self.controls_box.set_opacity(1.0)
+
+        # Idle source loading and tagging the rest of a long tab
+        self._lyrics_loading_id = None
+        self._lyrics_loaded_fraction = 1.0
+
+        # Prepared buffers by song URL: {"buffer", "content", "scroll"}
+        self.rendered_buffers = LRUCache(
+            MAX_RENDERED_BUFFERS,
+            max_bytes=MAX_RENDERED_BUFFER_BYTES,
+            sizeof=lambda entry: RENDERED_BUFFER_BYTES_PER_CHAR * len(entry["content"])
+        )
+        self._shown_lyrics = None
+
+        # ========== DEFERRED SETUP ==========
+        # Everything only needed on the chords page waits for the first frame
+        self._deferred_setup_done = False
+        after_first_frame(self, self._finish_deferred_setup)
+
+    def _finish_deferred_setup(self):
+        """Set up zoom, text tags, CSS and controllers not needed for the first frame."""
+        if self._deferred_setup_done:
+            return
+        self._deferred_setup_done = True
+
+        # ========== ZOOM MECHANISMS ==========
         # Apply loaded zoom size using CSS
         self.lyrics_view.add_css_class("zoomable-lyrics")
         self._lyrics_css_provider = Gtk.CssProvider()
@@ -136,7 +329,7 @@ class TabsWindow(Adw.ApplicationWindow):
             self._lyrics_css_provider,
             Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
         )
-        self.apply_zoom_change(0, initial_zoom)
+        self._apply_zoom_css(self._current_zoom_size)
 
         # Scroll zoom (Ctrl + Scroll)
         try:
@@ -153,35 +346,18 @@ class TabsWindow(Adw.ApplicationWindow):
         pinch_controller.set_propagation_phase(Gtk.PropagationPhase.CAPTURE)
         pinch_controller.connect("begin", self.on_pinch_zoom_begin)
         pinch_controller.connect("scale-changed", self.on_pinch_zoom_changed)
+        pinch_controller.connect("end", self.on_pinch_zoom_end)
+        pinch_controller.connect("cancel", self.on_pinch_zoom_cancel)
         self.lyrics_view.add_controller(pinch_controller)
+        # Pinching scales a picture of the page; the text is relaid out at the end
+        self.zoom_preview = ZoomPreview()
+        self.chords_view_overlay.add_overlay(self.zoom_preview)
 
         # Key zoom (Ctrl + +/-)
         key_controller = Gtk.EventControllerKey.new()
         key_controller.connect("key-pressed", self.on_key_zoom)
         self.add_controller(key_controller)
 
-        # Connect window close handler to save settings
-        self.connect("close-request", self.on_close_request)
-
-        # ========== LOAD FAVORITES ==========
-        if self.favorites:
-            for song in self.favorites:
-                self._add_song_to_list(song, self.favorites_list)
-        else:
-            self.favorites = []
-        self.songs_searched = self.favorites
-
-        # Connect favorite button on song page
-        self.fav_song_button.connect("clicked", self.on_fav_song_clicked)
-
-        # ============ HISTORY MANAGEMENT ============
-        # History stack (list of states, limited to MAX_HISTORY_SIZE)
-        self.history = []
-        # Initialize history with the starting state
-        self._push_history(["favorites"])
-        self.back_button.connect("clicked", self.on_back_clicked)
-        self.favorites_button.connect("clicked", self.on_favorites_clicked)
-
         # ========== TEXT COLORING ==========
         self.lyrics_buffer = self.lyrics_view.get_buffer()
 
@@ -228,34 +404,65 @@ class TabsWindow(Adw.ApplicationWindow):
         )
 
         # ========== OPACITY ANIMATION ==========
-        self.is_mouse_over_controls = False
-        self.current_opacity = 1.0  # Start at full opacity
-        self.target_opacity = 1.0
-        self.animation_speed = 0.1  # Animation speed (higher = faster)
-        self.animation_timeout_id = None
-
         # Mouse controllers for transparency management
         enter_controller = Gtk.EventControllerMotion.new()
         enter_controller.connect("enter", self.on_controls_enter)
         enter_controller.connect("leave", self.on_controls_leave)
         self.controls_box.add_controller(enter_controller)
 
-        # Initial opacity
-        self.controls_box.set_opacity(1.0)
+    # -----------------------
+    # STARTUP LOADING
+    # -----------------------
+    def _open_store(self):
+        """Writer thread: open the database, migrate old files and read favorites."""
+        os.makedirs(self.data_dir, exist_ok=True)
+        store = TabsStore(os.path.join(self.data_dir, "tabs.db"))
+        # Import the old cache.json (and config.json favorites) on first run
+        store.migrate_from_json(self.cache_file, self.config_file)
+        favorites = store.load_favorites()
+        queries = store.search_queries()
+        titles = store.song_titles()
+        self.store = store
+        GLib.idle_add(self._on_store_ready, favorites, queries, titles)
+        self._report_cache_stats()
+
+    def _on_store_ready(self, favorites, queries, titles):
+        """Main loop: show the stored favorites, keeping any added meanwhile, and fill suggestions."""
+        stored_urls = {song.get("song_url") for song in favorites}
+        added = [song for song in self.favorites if song.get("song_url") not in stored_urls]
+        self.favorites[:] = favorites + added
+        self._favorites_loaded = True
+        if added:
+            self._schedule_favorites_save()
+
+        self.favorites_store.splice(
+            0, self.favorites_store.get_n_items(),
+            [SongItem(song) for song in self.favorites]
+        )
+
+        for query in queries:
+            # Follow-up results pages are stored under their own keys
+            if "\n" not in query:
+                self.suggestions.add(query, QUERY_SUGGESTION_WEIGHT)
+        for song in self.favorites:
+            self._add_song_suggestions(song.get("song"), song.get("artist"), FAVORITE_SUGGESTION_WEIGHT)
+        for title, artist in titles:
+            self._add_song_suggestions(title, artist, SONG_SUGGESTION_WEIGHT)
+        return GLib.SOURCE_REMOVE
 
     # -----------------------
     # OPACITY ANIMATION
     # -----------------------
-    def animate_opacity(self):
-        """Smooth opacity animation."""
+    def animate_opacity(self, elapsed):
+        """Smooth opacity animation, one frame of `elapsed` seconds."""
         if abs(self.current_opacity - self.target_opacity) < 0.01:
             self.current_opacity = self.target_opacity
             self.controls_box.set_opacity(self.current_opacity)
-            self.animation_timeout_id = None
             return False  # Stop animation
 
-        # Linear interpolation
-        self.current_opacity += (self.target_opacity - self.current_opacity) * self.animation_speed
+        # Exponential easing, same curve as 60 FPS steps whatever the frame rate
+        progress = 1 - (1 - self.animation_speed) ** (elapsed * 60)
+        self.current_opacity += (self.target_opacity - self.current_opacity) * progress
         self.controls_box.set_opacity(self.current_opacity)
         return True  # Continue animation
 
@@ -264,11 +471,8 @@ class TabsWindow(Adw.ApplicationWindow):
         self.target_opacity = target_opacity
 
         # Start animation if not already running
-        if self.animation_timeout_id is None:
-            # Ensure old animation is removed if it exists
-            if self.animation_timeout_id is not None:
-                 GLib.source_remove(self.animation_timeout_id)
-            self.animation_timeout_id = GLib.timeout_add(16, self.animate_opacity)  # ~60 FPS
+        if not self.animator.is_running("opacity"):
+            self.animator.start("opacity", self.animate_opacity)
 
     # -----------------------
     # SCROLL HANDLERS
@@ -279,15 +483,11 @@ class TabsWindow(Adw.ApplicationWindow):
 
     def start_scroll(self):
         """Start automatic scrolling."""
-        if self.scroll_timeout_id is None and self.chords_scrolled_window:
-            # Update interval in ms
-            self.scroll_timeout_id = GLib.timeout_add(
-                self.scroll_interval,
-                self._auto_scroll_step
-            )
-            # Update icon and visibility
+        if not self.animator.is_running("scroll") and self.chords_scrolled_window:
+            self.animator.start("scroll", self._auto_scroll_step)
+            # Update icon and visibility (the speed only applies to free scrolling)
             self.play_pause_button.set_icon_name("media-playback-pause-symbolic")
-            self.speed_scale.set_visible(True)
+            self.speed_scale.set_visible(self._scroll_duration is None)
 
             # Animate to transparency only if mouse is not over controls
             if not self.is_mouse_over_controls:
@@ -295,9 +495,8 @@ class TabsWindow(Adw.ApplicationWindow):
 
     def stop_scroll(self):
         """Stop automatic scrolling."""
-        if self.scroll_timeout_id is not None:
-            GLib.source_remove(self.scroll_timeout_id)
-            self.scroll_timeout_id = None
+        if self.animator.is_running("scroll"):
+            self.animator.stop("scroll")
             # Update icon and visibility
             self.play_pause_button.set_icon_name("media-playback-start-symbolic")
             self.speed_scale.set_visible(False)
@@ -305,27 +504,38 @@ class TabsWindow(Adw.ApplicationWindow):
             # Animate to full opacity when scrolling stops
             self.start_opacity_animation(1.0)
 
-    def _auto_scroll_step(self):
-        """Perform a small scroll step."""
+    def _auto_scroll_step(self, elapsed):
+        """Scroll by the distance covered in `elapsed` seconds."""
         if not self.chords_scrolled_window:
-            return GLib.SOURCE_REMOVE
+            return False
 
         adj = self.chords_scrolled_window.get_vadjustment()
 
-        # Calculate new scroll amount based on adjusted speed
-        new_value = adj.get_value() + (self.scroll_amount * self.scroll_speed)
-
         # Upper is total content height, Page Size is visible window height
         max_value = adj.get_upper() - adj.get_page_size()
 
-        if new_value >= max_value:
+        # Distance depends on the frame time, not on how often frames come.
+        # With a song duration, the rate follows the measured layout height.
+        if self._scroll_duration is None:
+            rate = self.scroll_rate * self.scroll_speed
+        else:
+            # While a long tab is loading, extrapolate its full height
+            full_range = adj.get_upper() / self._lyrics_loaded_fraction - adj.get_page_size()
+            rate = full_range / self._scroll_duration
+        new_value = adj.get_value() + rate * elapsed
+
+        if new_value >= max_value and self._lyrics_loading_id is not None:
+            # More text is on its way: wait for it at the current end
+            adj.set_value(max_value)
+            return True
+        elif new_value >= max_value:
             # Reached end: stop scrolling
             adj.set_value(max_value)  # Ensure we're at the bottom
             self.stop_scroll()
-            return GLib.SOURCE_REMOVE  # Stop timer
+            return False  # Stop animation
         else:
             adj.set_value(new_value)
-            return GLib.SOURCE_CONTINUE  # Continue timer
+            return True  # Continue animation
 
     def on_play_pause_clicked(self, button):
         """Toggle between play and pause."""
@@ -333,7 +543,7 @@ class TabsWindow(Adw.ApplicationWindow):
         if self.leaflet.get_visible_child() != self.chords_view_overlay:
             return
 
-        if self.scroll_timeout_id is None:
+        if not self.animator.is_running("scroll"):
             self.start_scroll()
         else:
             self.stop_scroll()
@@ -348,9 +558,16 @@ class TabsWindow(Adw.ApplicationWindow):
         """When mouse leaves controls area."""
         self.is_mouse_over_controls = False
         # If scrolling is active, return to transparency
-        if self.scroll_timeout_id is not None:
+        if self.animator.is_running("scroll"):
             self.start_opacity_animation(0.3)
 
+    # -----------------------
+    # BACKGROUND WORK
+    # -----------------------
+    def on_worker_busy_changed(self, busy):
+        """Show the spinner while a search or song fetch is in flight."""
+        self.loading_spinner.set_visible(busy)
+
     # -----------------------
     # HISTORY HELPERS
     # -----------------------
@@ -370,129 +587,474 @@ class TabsWindow(Adw.ApplicationWindow):
         """Return the current state (last element in the stack)."""
         return self.history[-1] if self.history else ["favorites"]
 
-    # -----------------------
-    # UI HELPERS
-    # -----------------------
-    def _add_song_to_list(self, song, listbox):
-        """Helper: add a song row to a given listbox."""
-        # Grid container for song info
-        main_grid = Gtk.Grid(column_spacing=12, row_spacing=6)
-        main_grid.set_margin_top(15)
-        main_grid.set_margin_bottom(15)
-        main_grid.set_margin_start(15)
-        main_grid.set_margin_end(15)
-
-        # TITLE and ARTIST
-        title_markup = f'<span size="large" weight="bold">{song["song"]}</span>'
-        title_label = Gtk.Label(label="", xalign=0)
-        title_label.set_markup(title_markup)
-
-        # Enable word wrapping (GTK4)
-        title_label.set_wrap(True)
-        title_label.set_wrap_mode(Pango.WrapMode.WORD)
-        title_label.set_max_width_chars(100)
-        title_label.set_justify(Gtk.Justification.LEFT)
-        title_label.set_hexpand(True)
-
-        main_grid.attach(title_label, 0, 0, 2, 1)  # Takes 2 columns
-
-        artist_label = Gtk.Label(label=song.get('artist', 'N/A'), xalign=0)
-        artist_label.add_css_class("body")
-        main_grid.attach(artist_label, 0, 1, 1, 1)
-
-        # TYPE and RATING aligned to the right
-        type_label = Gtk.Label(label=f'Type: {song.get("type", "N/A")}', xalign=0)
-        type_label.add_css_class("caption")
-        main_grid.attach(type_label, 0, 2, 1, 1)
-
-        rating_label = Gtk.Label(label=f'Rating: {song.get("rating_full", "0")}', xalign=1)
-        rating_label.add_css_class("caption")
-        main_grid.attach(rating_label, 1, 2, 1, 1)
-
-        # Horizontal box: grid + spacer
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
-        hbox.append(main_grid)
-
-        # Spacer to push content to fill space
-        spacer = Gtk.Box()
-        spacer.set_hexpand(True)
-        hbox.append(spacer)
-
-        # Card and ListBoxRow
-        card_bin = Adw.Bin()
-        card_bin.add_css_class("card")
-        card_bin.set_child(hbox)
-
-        row = Gtk.ListBoxRow()
-        row.set_child(card_bin)
-        row.url = song["song_url"]
-
-        listbox.append(row)
-
     # -----------------------
     # NAVIGATION HANDLERS
     # -----------------------
     def on_search_activated(self, entry):
         """Handle search entry activation (Enter key)."""
-        text = entry.get_text()
-        if text:
-            songs = None
-            for cached_search in self.cached_searches:
-                if cached_search[0] == text:
-                    songs = cached_search[1]
+        self._cancel_typed_search()
+        self._confirmed_query = canonical_query(entry.get_text())
+        self._run_search(entry.get_text())
+
+    def _run_search(self, text, typed=False):
+        """
+        Show the results of a query: offline hits, then cached or streamed network results.
+
+        Args:
+            text (str): Query as typed; canonicalized for caching and fetching.
+            typed (bool): True for a search started by typing, replaced by the next one.
+        """
+        query = canonical_query(text)
+        if not query:
+            return
+        # The results take over from the suggestions
+        self.suggestions_popover.popdown()
+
+        state = self._get_current_state()
+        if state[0] == "search" and state[3] == query:
+            # Already shown (typed, then confirmed with Enter): keep it
+            if not typed:
+                state[4] = False
+                self._confirm_search(query)
+            return
+
+        # Songs already downloaded are listed first, even offline
+        local_songs = self._search_offline(query)
+        shown_urls = {song["song_url"] for song in local_songs}
+
+        songs = self._lookup_search(query)
+        if songs is None and self.cached_searches.is_missing(query):
+            # Recently searched without results: don't hit the network again
+            songs = []
+        if songs is not None:
+            # Follow-up pages cached with the first one
+            for page in range(2, MAX_SEARCH_PAGES + 1) if songs else ():
+                more = self._lookup_search(self._search_page_key(query, page))
+                if not more:
                     break
-            if not songs:
-                songs = fetch_freetar_results(text)
-                self.cached_searches.append([text, songs])
-                print("Added to cache")
+                songs = songs + more
+            self.worker.cancel("search")
+            self._pending_search = None
+            self._show_search_results(
+                local_songs + self._new_songs(songs, shown_urls), query, typed
+            )
+            self.prefetcher.prefetch_results(songs, PREFETCH_TOP_RESULTS)
+            if songs:
+                self._revalidate_search(query)
+            if not typed:
+                self._confirm_search(query)
+            return
 
-            if len(self.cached_searches) >= MAX_CACHED_SEARCHES:
-                self.cached_searches.pop(0)
-                print("Removed oldest cached search")
+        # Show the results page right away and fill it as rows are parsed,
+        # then as the follow-up pages complete, superseding any search still
+        # in flight
+        self.prefetcher.cancel()
+        songs = list(local_songs)
+        model = self._show_search_results(songs, query, typed)
+        self._stream_search_pages(query, songs, model.get_model(), shown_urls, typed)
 
-            # Clear previous results
-            children_to_remove = list(self.results_list)
-            for row in children_to_remove:
-                 self.results_list.remove(row)
+    def _stream_search_pages(self, query, songs, store, shown_urls, typed=False, page_count=None):
+        """
+        Fetch the results pages of a query, appending new rows as they arrive.
 
-            for song in songs:
-                self._add_song_to_list(song, self.results_list)
+        Args:
+            query (str): Canonical query.
+            songs (list): Songs shown, extended with the new ones.
+            store (Gio.ListStore): Model of the results list.
+            shown_urls (set): URLs already listed (de-duplication).
+            typed (bool): Search made while typing: first page only, not stored.
+            page_count (int): Known number of pages: only fetch the follow-up ones.
+        """
+        self._pending_search = query
+        pages = {}
+        fetched = {"page_count": page_count or 1}
+
+        def on_page_count(count):
+            # Worker thread; read by on_done once the job is over
+            fetched["page_count"] = count
+
+        def on_item(item):
+            page, song = item
+            if song is None:
+                self._on_search_page_fetched(query, page, pages.get(page, []), persist=not typed)
+                return
+            pages.setdefault(page, []).append(song)
+            for song in self._new_songs([song], shown_urls):
+                songs.append(song)
+                store.append(SongItem(song))
+
+        self.worker.submit_stream(
+            "search", iter_freetar_pages, query, 1 if typed else MAX_SEARCH_PAGES,
+            page_count, on_page_count,
+            on_item=on_item,
+            on_done=lambda items: self._on_search_fetched(query, pages, typed, fetched["page_count"])
+        )
 
-            # Ensure we're on the correct leaflet child
-            if self.leaflet.get_visible_child() == self.chords_view_overlay:
-                 # Go back to stack before changing stack page
-                 self.leaflet.navigate(Adw.NavigationDirection.BACK)
+    def _confirm_search(self, query):
+        """
+        Record a search made while typing once the user confirms it.
 
-            self.stack.set_visible_child_name("results")
-            # Update history
-            self._push_history(["search", songs])
-            self.songs_searched = songs
+        Confirming (Enter, a suggestion, opening a result) stores the query
+        with its results, offers it as a suggestion and fetches its
+        follow-up pages.
+        """
+        page_count = self._unconfirmed_searches.pop(query, None)
+        songs = self.cached_searches.get(query)
+        if page_count is None or not songs:
+            return
+        self.suggestions.add(query, QUERY_SUGGESTION_WEIGHT)
+        self.writer.submit(self._write_search, query, songs)
+
+        state = self._get_current_state()
+        if page_count > 1 and state[0] == "search" and state[3] == query:
+            shown_urls = {song["song_url"] for song in state[1]}
+            self._stream_search_pages(
+                query, state[1], state[2].get_model(), shown_urls, page_count=page_count
+            )
+
+    @staticmethod
+    def _search_page_key(query, page):
+        """Return the cache key of a results page (the query itself for the first one)."""
+        # Canonical queries never contain a newline, so keys can't collide
+        return query if page == 1 else f"{query}\npage {page}"
+
+    @staticmethod
+    def _new_songs(songs, shown_urls):
+        """Return the songs whose URL is not in shown_urls, adding them to it."""
+        new = []
+        for song in songs:
+            if song["song_url"] not in shown_urls:
+                shown_urls.add(song["song_url"])
+                new.append(song)
+        return new
+
+    def _lookup_search(self, text):
+        """Return cached results for a query from memory or the database."""
+        songs = self.cached_searches.get(text)
+        if songs is None and self.store is not None:
+            songs = self.store.get_search(text)
+            if songs is not None:
+                self.cached_searches.put(text, songs)
+                self.writer.submit(self.store.touch_search, text)
+        return songs
+
+    def _search_offline(self, text):
+        """Return cached songs matching a query from the local full-text index."""
+        if self.store is None:
+            return []
+        try:
+            return self.store.search_songs(text)
+        except Exception as e:
+            print(f"Offline search failed: {e}")
+            return []
+
+    def _lookup_song(self, url):
+        """Return cached song details from memory or the database."""
+        song_data = self.cached_songs.get(url)
+        if song_data is None and self.store is not None:
+            song_data = self.store.get_song(url)
+            if song_data is not None:
+                self.cached_songs.put(url, song_data)
+                # Writes wait for the writer thread, never for the main loop
+                self.writer.submit(self.store.touch_song, url)
+        return song_data
+
+    def on_search_changed(self, entry):
+        """Suggest completions, and search once the user stops typing."""
+        query = canonical_query(entry.get_text())
+        if query == self._confirmed_query:
+            # Set from a suggestion or confirmed with Enter: already searched
+            return
+        self._confirmed_query = None
+        # Discard the in-flight search once the user types a different query
+        if self._pending_search is not None and query != self._pending_search:
+            state = self._get_current_state()
+            if state[0] == "search" and state[3] == self._pending_search:
+                # Its results stay incomplete: searching it again must refetch
+                state[3] = None
+            self.worker.cancel("search")
+            self._pending_search = None
+
+        self._show_suggestions(query)
+        self._cancel_typed_search()
+        if len(query) >= MIN_TYPED_QUERY_LENGTH:
+            self._typed_search_id = GLib.timeout_add(
+                TYPED_SEARCH_DELAY_MS, self._on_typed_search_timeout
+            )
 
-    def on_row_activated(self, listbox, row):
+    def _on_typed_search_timeout(self):
+        """Run the search for the text typed so far."""
+        self._typed_search_id = None
+        self._run_search(self.search_entry.get_text(), typed=True)
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_typed_search(self):
+        """Drop a search waiting for the user to stop typing."""
+        if self._typed_search_id is not None:
+            GLib.source_remove(self._typed_search_id)
+            self._typed_search_id = None
+
+    def _show_suggestions(self, query):
+        """Fill the suggestions popover with completions of the query."""
+        suggestions = [
+            text for text in self.suggestions.complete(query, MAX_SUGGESTIONS + 1)
+            if canonical_query(text) != query
+        ][:MAX_SUGGESTIONS] if query else []
+
+        self.suggestions_list.remove_all()
+        for text in suggestions:
+            label = Gtk.Label(label=text, xalign=0, ellipsize=Pango.EllipsizeMode.END)
+            label.set_margin_top(6)
+            label.set_margin_bottom(6)
+            label.set_margin_start(6)
+            label.set_margin_end(6)
+            self.suggestions_list.append(label)
+        if suggestions:
+            self.suggestions_popover.popup()
+        else:
+            self.suggestions_popover.popdown()
+
+    def on_suggestion_activated(self, list_box, row):
+        """Search for the chosen suggestion right away."""
+        text = row.get_child().get_label()
+        self._confirmed_query = canonical_query(text)
+        self.search_entry.set_text(text)
+        self.search_entry.set_position(-1)
+        self.on_search_activated(self.search_entry)
+
+    def _add_song_suggestions(self, title, artist, weight):
+        """Offer a song's title and artist as search suggestions."""
+        for text in (title, artist):
+            if text and text != "N/A":
+                self.suggestions.add(text, weight)
+
+    def _on_search_page_fetched(self, text, page, songs, persist=True):
+        """
+        Cache a freshly fetched results page (already streamed into the list).
+
+        Pages of confirmed searches are also stored, and a first page with
+        results makes the query a suggestion.
+        """
+        key = self._search_page_key(text, page)
+        if songs:
+            self.cached_searches.put(key, songs)
+            if persist:
+                self.writer.submit(self._write_search, key, songs)
+                if page == 1:
+                    self.suggestions.add(text, QUERY_SUGGESTION_WEIGHT)
+                print(f"Added page {page} to cache")
+        elif page == 1:
+            self.cached_searches.mark_missing(text)
+
+    def _on_search_fetched(self, text, pages, typed=False, page_count=1):
+        """Prefetch the best results once every page of a search is in."""
+        self._pending_search = None
+        songs = [song for page in sorted(pages) for song in pages[page]]
+        if not songs:
+            return
+        if typed:
+            self._unconfirmed_searches[text] = page_count
+            while len(self._unconfirmed_searches) > MAX_LOADED_SEARCHES:
+                del self._unconfirmed_searches[next(iter(self._unconfirmed_searches))]
+            if any(state[0] == "search" and state[3] == text and not state[4] for state in self.history):
+                # Confirmed while it was loading
+                self._confirm_search(text)
+        self.prefetcher.prefetch_results(songs, PREFETCH_TOP_RESULTS)
+
+    def _show_search_results(self, songs, query=None, typed=False):
+        """
+        Display a list of search results on the results page.
+
+        Args:
+            songs (list): Song dictionaries; may be empty and filled later.
+            query (str): Canonical query the results belong to.
+            typed (bool): Started by typing: the next search replaces it in the history.
+
+        Returns:
+            Gtk.NoSelection: The model shown, so rows can be appended to it.
+        """
+        model = new_song_model(songs)
+        self.results_list.set_model(model)
+
+        # Ensure we're on the correct leaflet child
+        if self.leaflet.get_visible_child() == self.chords_view_overlay:
+             # Go back to stack before changing stack page
+             self.leaflet.navigate(Adw.NavigationDirection.BACK)
+
+        self.stack.set_visible_child_name("results")
+        # Update history (the model is kept so going back just swaps it in).
+        # Intermediate searches made while typing don't pile up in it.
+        state = self._get_current_state()
+        if state[0] == "search" and state[4]:
+            self.history.pop()
+        self._push_history(["search", songs, model, query, typed])
+        self.songs_searched = songs
+        return model
+
+    def on_row_activated(self, list_view, position):
         """Handle song row activation (click)."""
-        url = getattr(row, "url", None)
-        song_data = None
-        for cached_song in self.cached_songs:
-            if cached_song[0] == url:
-                song_data = cached_song[1]
-                if cached_song[1] == {}:
-                    self.cached_songs = [s for s in self.cached_songs if s[1] != {}]
-                break
-        if not song_data:
-            song_data = get_song_details(url.replace("https://www", "https://tabs"))
-            if song_data == {}:
-                print("Connection error")
-                return
-            self.cached_songs.append([url, song_data])
-            print("Song added to cache")
+        item = list_view.get_model().get_item(position)
+        if item is None:
+            return
+        url = item.song["song_url"]
+        state = self._get_current_state()
+        if state[0] == "search" and state[4]:
+            # Opening a result confirms a search made while typing
+            state[4] = False
+            self._confirm_search(state[3])
+
+        song_data = self._lookup_song(url)
+        if song_data:
+            self.worker.cancel("song")
+            self._show_song(url, song_data)
+            self._revalidate_song(url, song_data)
+            return
+
+        # Fetch in the background, superseding any song still loading. A
+        # prefetch of the same song already on the wire is shared, not repeated.
+        self.worker.submit(
+            "song", self._fetch_song_page, url,
+            on_done=lambda song_data: self._on_song_fetched(url, song_data)
+        )
+
+    @staticmethod
+    def _fetch_song_page(url, validators=None):
+        """
+        Worker thread: fetch song details from a result URL and index their chords.
+
+        Args:
+            url (str): Song URL as found in search results.
+            validators (dict): Validators of a cached copy; the page is then
+                only downloaded and parsed again if it changed.
+
+        Returns:
+            dict: Song details ({} on error, None if the cached copy is still current).
+        """
+        try:
+            song_data, validators = get_song_details_if_modified(
+                url.replace("https://www", "https://tabs"), validators
+            )
+        except urllib.error.URLError as e:
+            print(f"Error fetching URL {url}: {e}")
+            return {}
+        except Exception as e:
+            print(f"Unexpected error: {e}")
+            return {}
+        if song_data is None:
+            return None
+        song_data["chord_spans"] = compute_chord_spans(song_data["tab_content"])
+        song_data["line_index"] = compute_line_index(song_data["tab_content"])
+        song_data["validators"] = validators
+        song_data["fetched_at"] = time.time()
+        return song_data
+
+    # -----------------------
+    # REVALIDATION
+    # -----------------------
+    def _revalidate_song(self, url, song_data):
+        """Refresh a song shown from the cache in the background once its TTL has passed."""
+        if time.time() - song_data.get("fetched_at", 0) < self.song_ttl:
+            return
+        channel = f"revalidate-song:{url}"
+        if self.worker.is_busy(channel):
+            return
+        self.worker.submit(
+            channel, self._fetch_song_page, url, song_data.get("validators") or {},
+            on_done=lambda fresh: self._on_song_revalidated(url, song_data, fresh)
+        )
+
+    def _on_song_revalidated(self, url, song_data, fresh):
+        """Keep the cached song if unchanged, otherwise replace it (shown next time it is opened)."""
+        if fresh == {}:
+            # Offline or server error: try again on the next open
+            return
+        if fresh is None:
+            song_data["fetched_at"] = time.time()
+            self.writer.submit(self.store.refresh_song, url, dict(song_data))
+            return
+        # Stored apart from the song, only the copy in memory needs them
+        if "autoscroll" in song_data:
+            fresh["autoscroll"] = song_data["autoscroll"]
+        self.cached_songs.put(url, fresh)
+        self.writer.submit(self._write_song, url, fresh)
+        print("Song updated in cache")
+
+    def _revalidate_search(self, query):
+        """Refresh cached search results in the background once their TTL has passed."""
+        if self.store is None:
+            return
+        freshness = self.store.get_search_freshness(query)
+        if freshness is None:
+            return
+        fetched_at, validators = freshness
+        if time.time() - fetched_at < self.search_ttl:
+            return
+        channel = f"revalidate-search:{query}"
+        if self.worker.is_busy(channel):
+            return
+        self.worker.submit(
+            channel, fetch_freetar_results_if_modified, query, validators,
+            on_done=lambda result: self._on_search_revalidated(query, *result),
+            on_error=lambda e: print(f"Could not revalidate search '{query}': {e}")
+        )
+
+    def _on_search_revalidated(self, query, songs, validators):
+        """Store refreshed results and add new ones to the list if it is still shown."""
+        if songs is None:
+            self.writer.submit(self.store.refresh_search, query, validators)
+            return
+        if not songs:
+            return
+        self.cached_searches.put(query, songs)
+        self.writer.submit(self._write_search, query, songs, validators)
+        print("Search updated in cache")
+
+        state = self._get_current_state()
+        if state[0] == "search" and state[3] == query:
+            shown_urls = {song["song_url"] for song in state[1]}
+            store = state[2].get_model()
+            for song in songs:
+                if song["song_url"] not in shown_urls:
+                    state[1].append(song)
+                    store.append(SongItem(song))
+
+    def on_song_hovered(self, song):
+        """Prefetch a row the user is pointing at or pressing."""
+        self.prefetcher.prefetch(song.get("song_url"))
+
+    def _is_song_cached(self, url):
+        """Return True if a song is in memory or in the database."""
+        if url in self.cached_songs:
+            return True
+        return self.store is not None and self.store.has_song(url)
+
+    def _on_song_prefetched(self, url, song_data):
+        """Keep a prefetched song in memory and store it."""
+        if url in self.cached_songs:
+            return
+        self.cached_songs.put(url, song_data)
+        self.writer.submit(self._write_song, url, song_data)
+
+    def _on_song_fetched(self, url, song_data):
+        """Store freshly fetched song details and display them."""
+        if song_data == {}:
+            print("Connection error")
+            return
+        self.cached_songs.put(url, song_data)
+        self.writer.submit(self._write_song, url, song_data)
+        self._add_song_suggestions(song_data.get("title"), song_data.get("artist"), SONG_SUGGESTION_WEIGHT)
+        print("Song added to cache")
+        self._show_song(url, song_data)
+
+    def _show_song(self, url, song_data):
+        """Display song details and tab content on the chords page."""
+        # A song opened before the first frame still needs its tags and zoom
+        self._finish_deferred_setup()
+        self.suggestions_popover.popdown()
 
         # Navigate to chords view
         self.leaflet.set_visible_child(self.chords_view_overlay)
 
-        if len(self.cached_songs) >= MAX_CACHED_SONGS:
-            self.cached_songs.pop(0)
-            print("Removed oldest cached song")
-
         # SHOW SCROLLING CONTROLS
         self.play_pause_button.set_visible(True)
         self.speed_scale.set_visible(False)
@@ -534,7 +1096,12 @@ class TabsWindow(Adw.ApplicationWindow):
             if url in song["song_url"]:
                 self.current_song = song
                 break
-        is_favorite = self.current_song in self.favorites
+        # Offline hits are built from the stored song, not the search result:
+        # favorites are matched by URL, and shown as they were saved
+        favorite_index = self._favorite_index(self.current_song)
+        is_favorite = favorite_index >= 0
+        if is_favorite:
+            self.current_song = self.favorites[favorite_index]
         icon_name = "starred-symbolic" if is_favorite else "non-starred-symbolic"
         self.fav_icon.set_from_icon_name(icon_name)
 
@@ -542,25 +1109,27 @@ class TabsWindow(Adw.ApplicationWindow):
         self.source_link.set_label("View on Ultimate Guitar")
 
         # Apply text and chord coloring
-        self._set_lyrics_with_chord_colors(song_data['tab_content'])
+        if "chord_spans" not in song_data or "line_index" not in song_data:
+            # Cached before chords and sections were indexed: index it once and save it
+            song_data["chord_spans"] = compute_chord_spans(song_data["tab_content"])
+            song_data["line_index"] = compute_line_index(song_data["tab_content"])
+            self.writer.submit(self._write_song, url, song_data)
+        self._show_lyrics(url, song_data)
+        self._show_song_timing(url, song_data)
 
         # Update history
-        self._push_history(["song", song_data])
+        self._push_history(["song", song_data, url])
 
     def on_favorites_clicked(self, button):
         """Handle favorites button click."""
+        # Leaving the current page: a song still loading is no longer wanted
+        self.worker.cancel("song")
         if self.leaflet.get_visible_child() == self.chords_view_overlay:
             self.leaflet.navigate(Adw.NavigationDirection.BACK)
         # Update history
         self._push_history(["favorites"])
 
         self.stack.set_visible_child_name("favorites")
-        if self.favorites:
-            # Reload the favorites list
-            for child in list(self.favorites_list):
-                self.favorites_list.remove(child)
-            for song in self.favorites:
-                self._add_song_to_list(song, self.favorites_list)
 
     def on_back_clicked(self, button):
         """Handle back button click, navigating through history."""
@@ -568,6 +1137,9 @@ class TabsWindow(Adw.ApplicationWindow):
         if len(self.history) <= 1:
             return
 
+        # Any song still loading is no longer wanted
+        self.worker.cancel("song")
+
         # 1. Remove the current state from the history stack
         current_state = self.history.pop()
 
@@ -580,24 +1152,14 @@ class TabsWindow(Adw.ApplicationWindow):
             # Navigate leaflet back if needed
             self.leaflet.navigate(Adw.NavigationDirection.BACK)
             self.stack.set_visible_child_name("favorites")
-            # Reload favorites list
-            for child in list(self.favorites_list):
-                self.favorites_list.remove(child)
-            for song in self.favorites:
-                self._add_song_to_list(song, self.favorites_list)
 
         elif state_type == "search":
             # Navigate leaflet back if needed
             self.leaflet.navigate(Adw.NavigationDirection.BACK)
-            songs = destination_state[1]
             self.stack.set_visible_child_name("results")
 
-            # Reload previous search results
-            children_to_remove = list(self.results_list)
-            for row in children_to_remove:
-                 self.results_list.remove(row)
-            for song in songs:
-                self._add_song_to_list(song, self.results_list)
+            # Swap the previous search results back in
+            self.results_list.set_model(destination_state[2])
 
         elif state_type == "song":
             # Navigate leaflet to chords view
@@ -611,8 +1173,104 @@ class TabsWindow(Adw.ApplicationWindow):
             self.source_link.set_uri(song_data['original_url'])
             self.source_link.set_label("View on Ultimate Guitar")
 
-            buffer = self.lyrics_view.get_buffer()
-            buffer.set_text(song_data['tab_content'])
+            self._show_lyrics(destination_state[2], song_data)
+            self._show_song_timing(destination_state[2], song_data)
+
+    # -----------------------
+    # SONG TIMING AND SECTIONS
+    # -----------------------
+    def _show_song_timing(self, url, song_data):
+        """Load the autoscroll timing and section list of the song being shown."""
+        self.current_song_url = url
+        self.current_song_data = song_data
+        self.current_line_index = song_data.get("line_index") or compute_line_index(song_data["tab_content"])
+        self.scroll_settings = dict(song_data.get("autoscroll") or {"mode": "speed"})
+
+        # Reflect the settings without saving them back
+        self._loading_scroll_settings = True
+        self.duration_spin.set_value(self.scroll_settings.get("duration", self.duration_spin.get_value()))
+        self.bpm_spin.set_value(self.scroll_settings.get("bpm", self.bpm_spin.get_value()))
+        {
+            "duration": self.scroll_mode_duration,
+            "tempo": self.scroll_mode_tempo,
+        }.get(self.scroll_settings["mode"], self.scroll_mode_speed).set_active(True)
+        self._loading_scroll_settings = False
+        self._update_scroll_duration()
+
+        self.sections_list.remove_all()
+        for name, line, offset in self.current_line_index["sections"]:
+            label = Gtk.Label(label=name, xalign=0)
+            label.set_margin_top(6)
+            label.set_margin_bottom(6)
+            label.set_margin_start(6)
+            label.set_margin_end(6)
+            self.sections_list.append(label)
+        self.sections_button.set_visible(bool(self.current_line_index["sections"]))
+
+    def _update_scroll_duration(self):
+        """Work out the song duration once per settings change, not on every frame."""
+        settings = self.scroll_settings
+        self._scroll_duration = song_duration(
+            self.current_line_index, settings["mode"], settings.get("duration"), settings.get("bpm")
+        )
+        if self.animator.is_running("scroll"):
+            self.speed_scale.set_visible(self._scroll_duration is None)
+
+    def on_scroll_mode_toggled(self, button):
+        """Switch between free speed, song length and tempo autoscroll."""
+        if not button.get_active():
+            return
+        if button == self.scroll_mode_duration:
+            mode = "duration"
+        elif button == self.scroll_mode_tempo:
+            mode = "tempo"
+        else:
+            mode = "speed"
+        self._save_scroll_settings(mode=mode)
+
+    def on_scroll_timing_changed(self, spin_button):
+        """Store a new song length or tempo."""
+        self._save_scroll_settings(
+            duration=self.duration_spin.get_value(),
+            bpm=self.bpm_spin.get_value()
+        )
+
+    def _save_scroll_settings(self, **changes):
+        """Apply autoscroll settings and store them with the song."""
+        if self._loading_scroll_settings:
+            return
+        self.scroll_settings.update(changes)
+        self._update_scroll_duration()
+        if self.current_song_url is None:
+            return
+        self.current_song_data["autoscroll"] = dict(self.scroll_settings)
+        # Settings have their own table: the song itself is not rewritten
+        self.writer.schedule(
+            f"autoscroll:{self.current_song_url}",
+            lambda url=self.current_song_url, settings=self.current_song_data["autoscroll"]: (url, dict(settings)),
+            lambda args: self.store.put_song_settings(*args)
+        )
+
+    def on_section_activated(self, list_box, row):
+        """Scroll the chords page to the start of a section."""
+        sections = self.current_line_index["sections"]
+        index = row.get_index()
+        if not 0 <= index < len(sections):
+            return
+        self.sections_button.popdown()
+
+        # The cached offset gives the line directly, no need to search the text
+        buffer = self.lyrics_view.get_buffer()
+        text_iter = buffer.get_iter_at_offset(sections[index][2])
+        location = self.lyrics_view.get_iter_location(text_iter)
+        x, y = self.lyrics_view.buffer_to_window_coords(Gtk.TextWindowType.WIDGET, location.x, location.y)
+        viewport = self.chords_scrolled_window.get_child()
+        found, point = self.lyrics_view.compute_point(viewport, Graphene.Point().init(x, y))
+        if not found:
+            return
+
+        adj = self.chords_scrolled_window.get_vadjustment()
+        adj.set_value(min(adj.get_value() + point.y, adj.get_upper() - adj.get_page_size()))
 
     # -----------------------
     # ZOOM MANAGEMENT
@@ -632,20 +1290,36 @@ class TabsWindow(Adw.ApplicationWindow):
         return False
 
     def on_pinch_zoom_begin(self, gesture, sequence):
-        """Save current font size before pinch and claim gesture."""
+        """Save current font size before pinch, claim gesture and freeze a preview."""
         self._pinch_start_size = getattr(self, '_current_zoom_size', 10.0)
+        self._pinch_size = self._pinch_start_size
         gesture.set_state(Gtk.EventSequenceState.CLAIMED)
 
+        # Scale around the fingers
+        found, x, y = gesture.get_bounding_box_center()
+        pivot = Graphene.Point().init(x if found else 0, y if found else 0)
+        found, pivot = self.lyrics_view.compute_point(self.chords_view_overlay, pivot)
+        self.zoom_preview.start(
+            self.chords_scrolled_window, pivot.x if found else 0, pivot.y if found else 0
+        )
+
     def on_pinch_zoom_changed(self, gesture, scale):
-        """Apply zoom based on pinch gesture scaling."""
+        """Preview the pinch by scaling a picture of the page, without relayout."""
         base_size = self._pinch_start_size
-        new_size = max(6.0, min(base_size * scale, 36.0))
-        css_provider = self._lyrics_css_provider
-        css_string = f".zoomable-lyrics {{ font-size: {new_size}pt; }}"
-        css_provider.load_from_data(css_string.encode())
-        self._current_zoom_size = new_size
+        self._pinch_size = max(6.0, min(base_size * scale, 36.0))
+        self.zoom_preview.set_scale(self._pinch_size / base_size)
         return True
 
+    def on_pinch_zoom_end(self, gesture, sequence):
+        """Apply the final pinch size to the text."""
+        self.zoom_preview.stop()
+        self.apply_zoom_change(0, self._pinch_size)
+        self._schedule_config_save()
+
+    def on_pinch_zoom_cancel(self, gesture, sequence):
+        """Drop the preview of an interrupted pinch, keeping the previous size."""
+        self.zoom_preview.stop()
+
     def on_key_zoom(self, controller, keyval, keycode, state):
         """Handle zoom with Ctrl + +/- keys."""
         if not state & Gdk.ModifierType.CONTROL_MASK:
@@ -682,12 +1356,28 @@ class TabsWindow(Adw.ApplicationWindow):
         # Final clamp
         new_size = max(6.0, min(new_size, 36.0))
         self._current_zoom_size = new_size
+        if fixed_size is None:
+            self._schedule_config_save()
+
+        # Apply CSS change on the next frame: repeated key or scroll steps
+        # within a frame restyle the text only once, with the last size
+        if not self.animator.is_running("zoom"):
+            self.animator.start("zoom", self._on_zoom_frame)
+        return True
+
+    def _on_zoom_frame(self, elapsed):
+        """Restyle the text with the latest requested size (one-frame animation)."""
+        self._apply_zoom_css(self._current_zoom_size)
+        return False
 
-        # Apply CSS change
+    def _apply_zoom_css(self, size):
+        """Regenerate the zoom CSS, if the size changed since it was last applied."""
+        if size == self._applied_zoom_size:
+            return
+        self._applied_zoom_size = size
         css_provider = self._lyrics_css_provider
-        css_string = f".zoomable-lyrics {{ font-size: {new_size}pt; }}"
+        css_string = f".zoomable-lyrics {{ font-size: {size}pt; }}"
         css_provider.load_from_data(css_string.encode())
-        return True
 
     # -----------------------
     # FAVORITES MANAGEMENT
@@ -697,92 +1387,311 @@ class TabsWindow(Adw.ApplicationWindow):
         img = button.get_child()
         if img.get_icon_name() == "non-starred-symbolic":
             img.set_from_icon_name("starred-symbolic")
-            self.favorites.append(song)
+            self._add_favorite(song)
         else:
             img.set_from_icon_name("non-starred-symbolic")
-            if song in self.favorites:
-                self.favorites.remove(song)
+            self._remove_favorite(song)
+
+    def on_sync_favorites(self, action, param):
+        """Download every favorite that is missing or outdated, for offline use."""
+        if self.store is None or self.worker.is_busy("sync"):
+            return
+        urls = [song["song_url"] for song in self.favorites if song.get("song_url")]
+        self.sync_progress.set_fraction(0.0)
+        self.sync_progress.set_text("Checking favorites…")
+        self.sync_progress.set_visible(True)
+        self.worker.submit(
+            "sync", self._sync_favorites, urls,
+            on_done=self._on_sync_done, on_error=self._on_sync_done
+        )
+
+    def _sync_favorites(self, urls):
+        """Worker thread: download stale favorites, storing each as it arrives."""
+        stale = self.store.stale_songs(urls, self.song_ttl)
+        print(f"Offline sync: {len(stale)} of {len(urls)} favorites to download")
+        GLib.idle_add(self._on_sync_progress, 0, len(stale), 0)
+        failed = download_songs(
+            stale, self._fetch_song_page,
+            on_song=lambda url, song_data: self.writer.submit(self._write_song, url, song_data),
+            on_progress=lambda *progress: GLib.idle_add(self._on_sync_progress, *progress),
+            max_parallel=FAVORITES_SYNC_PARALLEL,
+            should_stop=self._sync_stop.is_set
+        )
+        return len(stale), failed
+
+    def _on_sync_progress(self, done, total, failed):
+        """Show the progress of an offline sync."""
+        if total:
+            self.sync_progress.set_fraction(done / total)
+        text = f"Downloading favorites: {done}/{total}"
+        if failed:
+            text += f" ({failed} failed)"
+        self.sync_progress.set_text(text)
+        return GLib.SOURCE_REMOVE
+
+    def _on_sync_done(self, result):
+        """Hide the progress bar and report the outcome of an offline sync."""
+        self.sync_progress.set_visible(False)
+        if isinstance(result, Exception):
+            print(f"Offline sync failed: {result}")
+            return
+        total, failed = result
+        print(f"Offline sync finished: {total - len(failed)} downloaded, {len(failed)} failed")
+
+    def _favorite_index(self, song):
+        """Return the position of a song in the favorites, matched by URL (-1 if absent)."""
+        url = song.get("song_url") if song else None
+        for index, favorite in enumerate(self.favorites):
+            if favorite.get("song_url") == url:
+                return index
+        return -1
+
+    def _add_favorite(self, song):
+        """Append a song to the favorites list and model."""
+        if self._favorite_index(song) >= 0:
+            return False
+        # Whether it is downloaded is only known at display time
+        song = {key: value for key, value in song.items() if key != "offline"}
+        self.favorites.append(song)
+        self.favorites_store.append(SongItem(song))
+        self._add_song_suggestions(song.get("song"), song.get("artist"), FAVORITE_SUGGESTION_WEIGHT)
+        self._schedule_favorites_save()
+        return True
+
+    def _remove_favorite(self, song):
+        """Remove a song from the favorites list and model."""
+        position = self._favorite_index(song)
+        if position < 0:
+            return False
+        del self.favorites[position]
+        self.favorites_store.remove(position)
+        self._schedule_favorites_save()
+        return True
+
+    # -----------------------
+    # PERSISTENCE
+    # -----------------------
+    def _schedule_config_save(self):
+        """Save the configuration shortly after the last change."""
+        self.writer.schedule(
+            "config",
+            lambda: {
+                "zoom_size": self._current_zoom_size,
+                "song_cache_budget": self.song_cache_budget,
+                "song_ttl": self.song_ttl,
+                "search_ttl": self.search_ttl,
+                "mirrors": mirrors.bases
+            },
+            self._write_config
+        )
+
+    def _write_config(self, config_data):
+        """Writer thread: atomically replace config.json."""
+        atomic_write_json(self.config_file, config_data)
+        print("Config saved")
+
+    def _close_store(self):
+        """Writer thread: close the database after the last queued write."""
+        if self.store is not None:
+            self.store.close()
+
+    def _report_cache_stats(self):
+        """Writer thread: print the song cache footprint and compression ratio."""
+        stats = self.store.stats()
+        print(
+            f"Song cache: {stats['songs']} songs, "
+            f"{stats['stored_bytes'] / 1024:.0f} KiB compressed from {stats['raw_bytes'] / 1024:.0f} KiB "
+            f"(ratio {stats['ratio']:.1f}x, budget {self.song_cache_budget / 1024:.0f} KiB), "
+            f"database {stats['file_bytes'] / 1024:.0f} KiB"
+        )
+
+    def _report_memory_footprint(self):
+        """Print the memory taken by the songs and text buffers loaded this session."""
+        print(
+            f"Loaded songs: {len(self.cached_songs)} "
+            f"({self.cached_songs.total_bytes / 1024:.0f} KiB of tab text, "
+            f"limit {MAX_LOADED_SONG_BYTES / 1024:.0f} KiB), "
+            f"text buffers: {len(self.rendered_buffers)} "
+            f"(about {self.rendered_buffers.total_bytes / 1024:.0f} KiB, "
+            f"limit {MAX_RENDERED_BUFFER_BYTES / 1024:.0f} KiB)"
+        )
+
+    def _schedule_favorites_save(self):
+        """Save the favorites shortly after the last change."""
+        if not self._favorites_loaded:
+            # Merged with the stored favorites once they are loaded
+            return
+        self.writer.schedule("favorites", lambda: list(self.favorites), self._write_favorites)
+
+    def _write_favorites(self, favorites):
+        """Writer thread: store the favorites list."""
+        self.store.save_favorites(favorites)
+
+    def _write_song(self, url, song_data):
+        """Writer thread: store a fetched song within the cache budget."""
+        self.store.put_song(url, song_data, self.song_cache_budget)
+
+    def _write_search(self, text, songs, validators=None):
+        """Writer thread: store fetched search results."""
+        self.store.put_search(text, songs, MAX_CACHED_SEARCHES, validators)
 
     # -----------------------
     # WINDOW CLOSE
     # -----------------------
     def on_close_request(self, window):
-        """Save zoom and favorites on window close."""
-        # Stop opacity animation if running
-        if self.animation_timeout_id is not None:
-            GLib.source_remove(self.animation_timeout_id)
-            self.animation_timeout_id = None
+        """Hand pending saves to the background writer and close right away."""
+        self.shutdown()
+        return False
 
-        # Save config
-        try:
-            os.makedirs(self.config_dir, exist_ok=True)
-            config_data = {
-                "zoom_size": self._current_zoom_size,
-                "favorites": self.favorites
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=4)
-        except Exception as e:
-            print(f"Could not save config: {e}")
-        else:
-            print("Config saved")
+    def shutdown(self):
+        """Stop background work and flush pending saves (safe to call twice)."""
+        if self._shut_down:
+            return
+        self._shut_down = True
+
+        # Drop pending background fetches
+        self._cancel_typed_search()
+        self.suggestions_popover.unparent()
+        self._sync_stop.set()
+        self.worker.shutdown()
+        self.prefetcher.shutdown()
+        stats = inflight.stats()
+        print(f"Shared requests: {stats['hits']} duplicates avoided, {stats['misses']} sent")
+        self._report_memory_footprint()
+
+        # Stop autoscroll and opacity animations if running
+        self.animator.stop_all()
+
+        # The writer thread finishes queued saves, then closes the database
+        self.writer.flush()
+        self.writer.submit(self._close_store)
+        self.writer.close()
+
+    def _show_lyrics(self, url, song_data):
+        """
+        Show the tab of a song, reusing its prepared buffer if it is cached.
 
-        # Save cache
-        try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-            cache_data = {
-                "cached_songs": self.cached_songs,
-                "cached_searches": self.cached_searches
-            }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=4)
-        except Exception as e:
-            print(f"Could not save cache: {e}")
+        Revisits and back navigation just swap the buffer on the view and
+        restore its scroll position; otherwise a new buffer is filled and
+        tagged, and kept for next time once it is complete.
+        """
+        adj = self.chords_scrolled_window.get_vadjustment()
+        if self._shown_lyrics is not None:
+            self._shown_lyrics["scroll"] = adj.get_value()
+
+        # Stop filling the previous buffer first: it was never cached, so a
+        # partly loaded one can't be picked up below
+        self._cancel_lyrics_loading()
+        entry = self.rendered_buffers.get(url)
+        if entry is not None and entry["content"] == song_data["tab_content"]:
+            self.lyrics_view.set_buffer(entry["buffer"])
         else:
-            print("Cache saved")
-        return False
-
-    def _set_lyrics_with_chord_colors(self, tab_content):
+            # Buffers share the tag table of the view's first buffer (chord_tag)
+            entry = {
+                "buffer": Gtk.TextBuffer(tag_table=self.lyrics_buffer.get_tag_table()),
+                "content": song_data["tab_content"],
+                "scroll": 0.0,
+            }
+            self.lyrics_view.set_buffer(entry["buffer"])
+            self._set_lyrics_with_chord_colors(
+                song_data["tab_content"], song_data["chord_spans"],
+                on_loaded=lambda: self.rendered_buffers.put(url, entry)
+            )
+        self._shown_lyrics = entry
+
+        # Restore the position once the new buffer has been laid out
+        GLib.idle_add(self._restore_lyrics_scroll, entry)
+
+    def _restore_lyrics_scroll(self, entry):
+        if entry is self._shown_lyrics:
+            self.chords_scrolled_window.get_vadjustment().set_value(entry["scroll"])
+        return GLib.SOURCE_REMOVE
+
+    def _cancel_lyrics_loading(self):
+        """Stop loading and tagging the previous song in idle time, if still running."""
+        if self._lyrics_loading_id is not None:
+            GLib.source_remove(self._lyrics_loading_id)
+            self._lyrics_loading_id = None
+        self._lyrics_loaded_fraction = 1.0
+
+    @staticmethod
+    def _text_chunk_end(text, start, lines):
+        """Return the offset just after `lines` lines of text from `start`."""
+        end = start
+        for _ in range(lines):
+            end = text.find("\n", end) + 1
+            if end == 0:
+                return len(text)
+        return end
+
+    def _set_lyrics_with_chord_colors(self, tab_content, chord_spans, on_loaded=None):
         """
-        Set text content and apply 'chord_tag' to identified chords.
+        Set text content and apply 'chord_tag' to precomputed chord spans.
+
+        The first screenful is inserted and tagged right away; on long tabs
+        the rest of the text is appended, and its chords tagged, in
+        idle-time chunks so the first screen shows immediately.
 
         Args:
             tab_content (str): The tab content with chords and lyrics
+            chord_spans (list): Delta-encoded spans from compute_chord_spans()
+            on_loaded (callable): Called once all the text is inserted and
+                tagged; not called if the loading is cancelled.
         """
         buffer = self.lyrics_view.get_buffer()
 
-        # Reset the buffer and remove previous tags
-        buffer.set_text(tab_content)
-
-        # Get iterators for the start and end of the buffer
-        start_iter = buffer.get_start_iter()
-        end_iter = buffer.get_end_iter()
-
-        # Remove all instances of the chord_tag from the entire text
-        buffer.remove_tag_by_name("chord_tag", start_iter, end_iter)
-
-        # Pattern for identifying chords in tab content
-        chord_pattern = r'([A-G][b#]?(m|min|maj|sus|aug|dim|add|7|9|11|13)*(\/[A-G][b#]?)?)\b'
-
-        # Find all matches using regex
-        for match in re.finditer(chord_pattern, tab_content):
-            text = match.group(1).strip()
-
-            # Only process if the matched text is a plausible chord
-            if len(text) >= 1 and not text.islower():
-                start_index = match.start(1)
-                end_index = match.end(1)
-
-                # Get iterators by character index
-                start_match_iter = buffer.get_iter_at_offset(start_index)
-                end_match_iter = buffer.get_iter_at_offset(end_index)
+        # Stop loading the previous song
+        self._cancel_lyrics_loading()
+
+        # Replacing the text also drops the previous tags
+        loaded = self._text_chunk_end(tab_content, 0, LYRICS_FIRST_CHUNK_LINES)
+        buffer.set_text(tab_content[:loaded])
+
+        chord_tag = buffer.get_tag_table().lookup("chord_tag")
+        state = {"index": 0, "offset": 0, "loaded": loaded}
+
+        def apply_chunk(count):
+            # Walk forward from the previous chunk instead of seeking each chord from the start
+            start_iter = buffer.get_iter_at_offset(state["offset"])
+            index = state["index"]
+            offset = state["offset"]
+            stop = min(index + 2 * count, len(chord_spans))
+            while index < stop:
+                end = offset + chord_spans[index] + chord_spans[index + 1]
+                if end > state["loaded"]:
+                    # Not inserted yet: tagged with a later chunk
+                    break
+                start_iter.forward_chars(chord_spans[index])
+                end_iter = start_iter.copy()
+                end_iter.forward_chars(chord_spans[index + 1])
+                buffer.apply_tag(chord_tag, start_iter, end_iter)
+                start_iter = end_iter
+                offset = end
+                index += 2
+            state["index"] = index
+            state["offset"] = offset
+            return index < len(chord_spans)
+
+        def load_idle_chunk():
+            if state["loaded"] < len(tab_content):
+                loaded = self._text_chunk_end(tab_content, state["loaded"], LYRICS_IDLE_CHUNK_LINES)
+                buffer.insert(buffer.get_end_iter(), tab_content[state["loaded"]:loaded])
+                state["loaded"] = loaded
+                self._lyrics_loaded_fraction = loaded / len(tab_content)
+            more_chords = apply_chunk(CHORD_SPANS_IDLE_CHUNK)
+            if more_chords or state["loaded"] < len(tab_content):
+                return GLib.SOURCE_CONTINUE
+            self._lyrics_loading_id = None
+            if on_loaded is not None:
+                on_loaded()
+            return GLib.SOURCE_REMOVE
 
-                # Apply the tag
-                buffer.apply_tag_by_name(
-                    "chord_tag",
-                    start_match_iter,
-                    end_match_iter
-                )
+        more_chords = apply_chunk(CHORD_SPANS_FIRST_CHUNK)
+        if more_chords or loaded < len(tab_content):
+            self._lyrics_loaded_fraction = loaded / len(tab_content)
+            self._lyrics_loading_id = GLib.idle_add(load_idle_chunk)
+        elif on_loaded is not None:
+            on_loaded()
 
     def on_fav_song_clicked(self, button):
         """Toggle favorite status of the currently displayed song."""
@@ -792,14 +1701,12 @@ class TabsWindow(Adw.ApplicationWindow):
         if img.get_icon_name() == "non-starred-symbolic":
             # Add to favorites
             img.set_from_icon_name("starred-symbolic")
-            if song not in self.favorites:
-                self.favorites.append(song)
+            if self._add_favorite(song):
                 print("Favorite added")
         else:
             # Remove from favorites
             img.set_from_icon_name("non-starred-symbolic")
-            if song in self.favorites:
-                self.favorites.remove(song)
+            if self._remove_favorite(song):
                 print("Favorite removed")
 
     def on_leaflet_visible_child_changed(self, leaflet, pspec):
@@ -812,9 +1719,7 @@ class TabsWindow(Adw.ApplicationWindow):
             self.speed_scale.set_visible(False)
             self.stop_scroll()  # Stop scrolling if changing page
             # Stop opacity animation
-            if self.animation_timeout_id is not None:
-                GLib.source_remove(self.animation_timeout_id)
-                self.animation_timeout_id = None
+            self.animator.stop("opacity")
             # Reset mouse state
             self.is_mouse_over_controls = False
 
@@ -828,5 +1733,5 @@ class TabsWindow(Adw.ApplicationWindow):
             self.play_pause_button.set_visible(True)
             self.speed_scale.set_visible(False)
             # Ensure opacity is correct
-            if self.scroll_timeout_id is None:
+            if not self.animator.is_running("scroll"):
                 self.start_opacity_animation(1.0)  # No scrolling = full opacity
@@ -0,0 +1,141 @@
+# worker.py
+from concurrent.futures import ThreadPoolExecutor
+from gi.repository import GLib
+
+
+class BackgroundWorker:
+    """
+    Run blocking calls (network requests, parsing) on a thread pool and
+    deliver their results back to the GTK main loop through GLib.idle_add.
+
+    Jobs are grouped by channel ("search", "song", ...). Only the latest job
+    of a channel is relevant: submitting a new one cancels the previous job
+    if it has not started yet, and discards its result if it is already
+    running. All public methods must be called from the main loop.
+    """
+    def __init__(self, max_workers=4, on_busy_changed=None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="tabs-worker"
+        )
+        self._generations = {}
+        self._futures = {}
+        self._on_busy_changed = on_busy_changed
+        self._busy = False
+
+    def submit(self, channel, func, *args, on_done=None, on_error=None):
+        """
+        Run func(*args) in the background, superseding the channel's previous job.
+
+        Args:
+            channel (str): Name of the channel the job belongs to.
+            func (callable): Blocking function to run in a worker thread.
+            on_done (callable): Called on the main loop with the result.
+            on_error (callable): Called on the main loop with the raised exception.
+
+        Returns:
+            int: Generation number identifying this job in its channel.
+        """
+        self.cancel(channel)
+        generation = self._generations[channel]
+        self._futures[channel] = self._executor.submit(
+            self._run, channel, generation, func, args, on_done, on_error
+        )
+        self._update_busy()
+        return generation
+
+    def submit_stream(self, channel, func, *args, on_item=None, on_done=None, on_error=None):
+        """
+        Iterate func(*args) in the background, delivering each item as it is produced.
+
+        Iteration stops as soon as the job is superseded or cancelled, so a
+        stale download is abandoned instead of being read to the end.
+
+        Args:
+            channel (str): Name of the channel the job belongs to.
+            func (callable): Returns an iterable of items (e.g. a generator).
+            on_item (callable): Called on the main loop with each item, in order.
+            on_done (callable): Called on the main loop with the list of all items.
+            on_error (callable): Called on the main loop with the raised exception.
+
+        Returns:
+            int: Generation number identifying this job in its channel.
+        """
+        self.cancel(channel)
+        generation = self._generations[channel]
+
+        def iterate():
+            items = []
+            for item in func(*args):
+                if not self.is_current(channel, generation):
+                    break
+                items.append(item)
+                if on_item is not None:
+                    GLib.idle_add(self._deliver_item, channel, generation, on_item, item)
+            return items
+
+        self._futures[channel] = self._executor.submit(
+            self._run, channel, generation, iterate, (), on_done, on_error
+        )
+        self._update_busy()
+        return generation
+
+    def cancel(self, channel):
+        """Cancel the pending job of a channel and discard its result."""
+        self._generations[channel] = self._generations.get(channel, 0) + 1
+        future = self._futures.pop(channel, None)
+        if future is not None:
+            future.cancel()
+        self._update_busy()
+
+    def is_current(self, channel, generation):
+        """Return True if the given job is still the latest of its channel."""
+        return self._generations.get(channel) == generation
+
+    def is_busy(self, channel=None):
+        """Return True if a job is in flight (on the channel, or on any channel)."""
+        if channel is not None:
+            return channel in self._futures
+        return bool(self._futures)
+
+    def shutdown(self):
+        """Drop every pending job without waiting for running ones."""
+        for channel in list(self._futures):
+            self.cancel(channel)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, channel, generation, func, args, on_done, on_error):
+        """Worker thread side: run the job and schedule its delivery."""
+        try:
+            result = func(*args)
+        except Exception as e:
+            GLib.idle_add(self._deliver, channel, generation, on_error, e)
+        else:
+            GLib.idle_add(self._deliver, channel, generation, on_done, result)
+
+    def _deliver(self, channel, generation, callback, value):
+        """Main loop side: hand the result over unless the job went stale."""
+        if not self.is_current(channel, generation):
+            return GLib.SOURCE_REMOVE
+
+        self._futures.pop(channel, None)
+        self._update_busy()
+        if callback is not None:
+            callback(value)
+        elif isinstance(value, Exception):
+            print(f"Background job '{channel}' failed: {value}")
+        return GLib.SOURCE_REMOVE
+
+    def _deliver_item(self, channel, generation, callback, item):
+        """Main loop side: hand over one streamed item unless the job went stale."""
+        if self.is_current(channel, generation):
+            callback(item)
+        return GLib.SOURCE_REMOVE
+
+    def _update_busy(self):
+        """Notify the busy callback when the in-flight state changes."""
+        busy = self.is_busy()
+        if busy != self._busy:
+            self._busy = busy
+            if self._on_busy_changed is not None:
+                self._on_busy_changed(busy)
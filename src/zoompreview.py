@@ -0,0 +1,61 @@
+# zoompreview.py
+from gi.repository import Gtk, Graphene
+
+
+class ZoomPreview(Gtk.Widget):
+    """
+    Scaled picture of a widget, shown while a pinch gesture is in progress.
+
+    Scaling a frozen image of the text only needs a redraw, whereas a new
+    font size restyles and relayouts the whole text view. The real size is
+    applied once, when the gesture ends.
+    """
+    __gtype_name__ = 'TabsZoomPreview'
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._image = None
+        self._scale = 1.0
+        self._pivot = (0.0, 0.0)
+        # Painted over the text with the same background, never takes input
+        self.add_css_class("view")
+        self.set_can_target(False)
+        self.set_visible(False)
+
+    def start(self, widget, pivot_x, pivot_y):
+        """
+        Freeze the current look of a widget and show it at its real size.
+
+        Args:
+            widget (Gtk.Widget): Widget to preview, covered by this one.
+            pivot_x (float): Horizontal position kept in place while scaling.
+            pivot_y (float): Vertical position kept in place while scaling.
+        """
+        self._image = Gtk.WidgetPaintable.new(widget).get_current_image()
+        self._scale = 1.0
+        self._pivot = (pivot_x, pivot_y)
+        self.set_visible(True)
+        self.queue_draw()
+
+    def set_scale(self, scale):
+        """Redraw the image at a new scale (no relayout)."""
+        if scale != self._scale:
+            self._scale = scale
+            self.queue_draw()
+
+    def stop(self):
+        """Hide the preview and drop the image."""
+        self.set_visible(False)
+        self._image = None
+
+    def do_snapshot(self, snapshot):
+        if self._image is None:
+            return
+        width, height = self.get_width(), self.get_height()
+        x, y = self._pivot
+        snapshot.push_clip(Graphene.Rect().init(0, 0, width, height))
+        snapshot.translate(Graphene.Point().init(x, y))
+        snapshot.scale(self._scale, self._scale)
+        snapshot.translate(Graphene.Point().init(-x, -y))
+        self._image.snapshot(snapshot, width, height)
+        snapshot.pop()
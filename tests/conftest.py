@@ -0,0 +1,15 @@
+# conftest.py
+import importlib.util
+import pathlib
+import sys
+
+# The modules in src/ are installed as the "tabs" package: import them the same way
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+
+if "tabs" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "tabs", SRC_DIR / "__init__.py", submodule_search_locations=[str(SRC_DIR)]
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["tabs"] = package
+    spec.loader.exec_module(package)
@@ -0,0 +1,77 @@
+# test_mirrors.py
+import asyncio
+import threading
+import urllib.error
+
+import pytest
+
+from tabs.mirrors import MirrorPool
+
+PRIMARY = "https://one.example/"
+SECONDARY = "https://two.example/"
+
+
+def make_pool():
+    return MirrorPool([PRIMARY, SECONDARY], failure_threshold=1, default_hedge_delay=0.05, min_hedge_delay=0.05)
+
+
+def test_call_async_fails_over_and_opens_the_breaker():
+    pool = make_pool()
+
+    async def get(url):
+        if url.startswith(PRIMARY):
+            raise urllib.error.URLError("down")
+        return url
+
+    assert asyncio.run(pool.call_async("tab/song", get)) == SECONDARY + "tab/song"
+    # The failed mirror is skipped until its cooldown is over
+    assert pool.ranked() == [SECONDARY, PRIMARY]
+
+
+def test_call_async_hedges_a_slow_mirror():
+    pool = make_pool()
+    cancelled = []
+
+    async def get(url):
+        if url.startswith(PRIMARY):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        return url
+
+    assert asyncio.run(pool.call_async("tab/song", get)) == SECONDARY + "tab/song"
+    assert cancelled == [PRIMARY + "tab/song"]
+
+
+def test_call_async_raises_client_errors_at_once():
+    pool = make_pool()
+    tried = []
+
+    async def get(url):
+        tried.append(url)
+        raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+
+    with pytest.raises(urllib.error.HTTPError):
+        asyncio.run(pool.call_async("tab/missing", get))
+    assert tried == [PRIMARY + "tab/missing"]
+    assert pool.ranked()[0] == PRIMARY
+
+
+def test_call_does_not_hedge_while_the_primary_is_queued():
+    pool = make_pool()
+    # Fill the pool so the next request waits for a free thread
+    gate = threading.Event()
+    blockers = [pool._executor.submit(gate.wait, 5) for _ in range(pool._executor._max_workers)]
+    tried = []
+
+    def get(url):
+        tried.append(url)
+        return url
+
+    threading.Timer(0.3, gate.set).start()
+    assert pool.call("tab/song", get) == PRIMARY + "tab/song"
+    assert tried == [PRIMARY + "tab/song"]
+    for blocker in blockers:
+        blocker.result()
@@ -0,0 +1,228 @@
+# test_scraper.py
+import html
+import pathlib
+import re
+from html.parser import HTMLParser
+
+import pytest
+
+from tabs.scraper import FreetarTabsParser
+
+FIXTURES_DIR = pathlib.Path(__file__).resolve().parent / "fixtures"
+TAB_PAGES = sorted(FIXTURES_DIR.glob("tab_*.html"))
+
+
+# -----------------------
+# Reference implementation
+# -----------------------
+class LegacyTabsParser(HTMLParser):
+    """FreetarTabsParser as it was before the single-pass rewrite, kept as a reference."""
+    def __init__(self):
+        super().__init__()
+        self.details = {
+            "title": "N/A",
+            "artist": "N/A",
+            "tuning": "N/A",
+            "difficulty": "N/A",
+            "capo": "N/A",
+            "type": "N/A",
+            "original_url": "N/A",
+            "tab_content": ""
+        }
+        self.in_h5 = False
+        self.in_title_link = False
+        self.tab_content_started = False
+        self.ignore_data = False
+        self.depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        """
+        Handle the start of an HTML tag for tab parsing.
+        """
+        attrs = dict(attrs)
+
+        # Start capturing tab content after <hr>
+        if tag == "hr":
+            self.tab_content_started = True
+
+        # Ignore chord visuals
+        if tag in ('div', 'script', 'table', 'tbody', 'tr', 'td', 'th'):
+            if attrs.get("id") == "chordVisuals":
+                self.ignore_data = True
+            elif self.ignore_data:
+                self.depth += 1
+
+        if self.ignore_data:
+            return
+
+        # Artist and title
+        if tag == "h5":
+            self.in_h5 = True
+        elif self.in_h5 and tag == "a" and self.details["artist"] == "N/A":
+            self.in_title_link = True
+
+        # Original URL
+        elif tag == "a" and attrs.get("href", "").startswith("https://tabs.ultimate-guitar.com"):
+            self.details["original_url"] = attrs["href"].replace("?no_redirect", "")
+
+        # Tab type
+        elif tag == "span":
+            cls = attrs.get("class")
+            if cls and "favorite" in cls:
+                self.details["type"] = attrs.get("data-type", "N/A")
+
+        # Tags that imply a line break
+        if self.tab_content_started and tag in ("br", "p", "div", "tr"):
+            self.details["tab_content"] += "\n"
+
+    def handle_data(self, data):
+        """
+        Handle text content inside HTML tags.
+        """
+        if self.ignore_data:
+            return
+
+        text = html.unescape(data)
+        if not text.strip() and not text.endswith("\n"):
+            # Preserve actual spaces
+            self.details["tab_content"] += text.replace("\xa0", "\xa0\xa0")
+            return
+
+        if self.in_title_link and self.details["artist"] == "N/A":
+            self.details["artist"] = text.strip()
+        elif self.in_h5 and self.details["artist"] != "N/A" and self.details["title"] == "N/A" and text not in ["-", self.details["artist"]]:
+            self.details["title"] = text.replace('(ver 1)', '').strip()
+        elif self.tab_content_started:
+            self.details["tab_content"] += text
+
+    def handle_endtag(self, tag):
+        """
+        Handle the end of an HTML tag.
+        """
+        if tag == "h5":
+            self.in_h5 = False
+        elif tag == "a":
+            self.in_title_link = False
+
+        if self.ignore_data and tag in ('div', 'script', 'input', 'table', 'tbody', 'tr', 'td', 'th'):
+            if self.depth > 0:
+                self.depth -= 1
+            else:
+                self.ignore_data = False
+
+        # Add line break at the end of paragraph-like tags
+        if self.tab_content_started and tag in ("p", "div", "br", "tr"):
+            self.details["tab_content"] += "\n"
+
+    def set_metadata_from_raw_html(self, raw_html):
+        """
+        Extract metadata like difficulty, capo, and tuning using regex from raw HTML.
+        """
+        difficulty_match = re.search(r'Difficulty: (.*?)<br>', raw_html)
+        if difficulty_match:
+            self.details["difficulty"] = difficulty_match.group(1).strip()
+
+        capo_match = re.search(r'Capo: (.*?) </div>', raw_html)
+        if capo_match:
+            self.details["capo"] = capo_match.group(1).strip()
+
+        tuning_match = re.search(r'Tuning: (.*?) \(Standard\)<br>', raw_html)
+        if tuning_match:
+            self.details["tuning"] = tuning_match.group(1).strip()
+
+    def clean_tab_content(self):
+        """
+        Clean tab content:
+        - Remove excessive empty lines at the start/end
+        - Remove scripts and "Alternative versions" text
+        - Normalize line breaks
+        """
+        content = self.details["tab_content"]
+
+        # Remove scripts and "Alternative versions"
+        content = re.sub(r"\$\(document\).*", "", content, flags=re.DOTALL)
+        content = re.sub(r"Alternative versions.*", "", content, flags=re.DOTALL)
+
+        # Clean up empty lines
+        lines = content.splitlines()
+        cleaned_lines = []
+
+        for line in lines:
+            l = line.rstrip()
+            if l.strip() == "":
+                if cleaned_lines and cleaned_lines[-1] != "":
+                    cleaned_lines.append("")
+            else:
+                cleaned_lines.append(l)
+
+        # Remove leading/trailing empty lines
+        while cleaned_lines and cleaned_lines[0] == "":
+            cleaned_lines.pop(0)
+        while cleaned_lines and cleaned_lines[-1] == "":
+            cleaned_lines.pop(-1)
+
+        self.details["tab_content"] = "\n".join(cleaned_lines)
+
+
+
+def parse_legacy(page):
+    parser = LegacyTabsParser()
+    parser.feed(page)
+    parser.set_metadata_from_raw_html(page)
+    parser.clean_tab_content()
+    return parser.details
+
+
+def parse(page, chunk_size=None):
+    parser = FreetarTabsParser()
+    if chunk_size is None:
+        parser.feed(page)
+    else:
+        for start in range(0, len(page), chunk_size):
+            parser.feed(page[start:start + chunk_size])
+    return parser.finish()
+
+
+# -----------------------
+# Tests
+# -----------------------
+@pytest.mark.parametrize("path", TAB_PAGES, ids=lambda path: path.name)
+def test_tab_page_matches_legacy_parser(path):
+    page = path.read_text(encoding="utf-8")
+    assert parse(page) == parse_legacy(page)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+@pytest.mark.parametrize("path", TAB_PAGES, ids=lambda path: path.name)
+def test_metadata_does_not_depend_on_chunking(path, chunk_size):
+    page = path.read_text(encoding="utf-8")
+    expected = parse_legacy(page)
+    details = parse(page, chunk_size)
+    for field in ("difficulty", "capo", "tuning"):
+        assert details[field] == expected[field]
+
+
+@pytest.mark.parametrize("snippet", [
+    "Difficulty: easy<br/>more<br>",
+    '<script>var s="Difficulty: x<br>"</script>',
+    "Capo: 3 </DIV>",
+    "Capo: <!-- c --> 2 </div>",
+    "Tuning: D&amp;G (Standard)<br>",
+    '<div title="Capo: 4 </div>">',
+    "<![CDATA[Difficulty: cdata<br>]]>",
+    "Difficulty: split\nline<br>",
+])
+def test_metadata_edge_cases_match_legacy_parser(snippet):
+    page = f"<html><body>{snippet}<hr><pre>Am</pre></body></html>"
+    expected = parse_legacy(page)
+    assert parse(page) == expected
+    details = parse(page, chunk_size=3)
+    for field in ("difficulty", "capo", "tuning"):
+        assert details[field] == expected[field]
+
+
+def test_metadata_is_read_from_raw_html():
+    details = parse((FIXTURES_DIR / "tab_edge_cases.html").read_text(encoding="utf-8"))
+    assert details["difficulty"] == "from an attribute"
+    assert details["tuning"] == "from script"
+    assert details["capo"] == "from a comment"
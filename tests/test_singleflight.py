@@ -0,0 +1,45 @@
+# test_singleflight.py
+import threading
+import time
+
+from tabs.singleflight import SingleFlight
+
+
+def test_stream_followers_get_their_own_items():
+    flight = SingleFlight()
+
+    def rows():
+        yield {"song": "First"}
+        yield {"song": "Second"}
+        return {"page_count": 1}
+
+    leader = flight.stream("search", rows)
+    first = next(leader)
+    # The leader's caller adds fields to its rows, like the window does
+    first["song_url"] = "https://freetar.example/tab/first"
+
+    follower_items = []
+    follower_result = []
+
+    def follow():
+        follower_result.append((yield from flight.stream("search", rows)))
+
+    def run_follower():
+        for item in follow():
+            item["seen"] = True
+            follower_items.append(item)
+
+    thread = threading.Thread(target=run_follower)
+    thread.start()
+    # Let the follower join while the leader is between two items
+    deadline = time.monotonic() + 5
+    while flight.stats()["hits"] == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    second = next(leader)
+    for _ in leader:
+        pass
+    thread.join(5)
+
+    assert follower_items == [{"song": "First", "seen": True}, {"song": "Second", "seen": True}]
+    assert "seen" not in first and "seen" not in second
+    assert follower_result == [{"page_count": 1}]
@@ -0,0 +1,74 @@
+# test_storage.py
+import json
+import sqlite3
+
+import pytest
+
+from tabs.storage import TabsStore
+
+URL = "https://freetar.example/tab/artist/song"
+SONG = {"title": "Song", "artist": "Artist", "type": "Chords", "tab_content": "[Verse]\nAm C G"}
+AUTOSCROLL = {"mode": "tempo", "bpm": 96.0}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TabsStore(str(tmp_path / "tabs.db"))
+    yield store
+    store.close()
+
+
+def test_settings_survive_a_new_download(store):
+    store.put_song(URL, SONG)
+    store.put_song_settings(URL, AUTOSCROLL)
+    # A sync or revalidation stores the freshly downloaded song
+    store.put_song(URL, dict(SONG, tab_content="[Verse]\nAm C G F"))
+    assert store.get_song(URL)["autoscroll"] == AUTOSCROLL
+
+
+def test_settings_are_not_stored_in_song_metadata(store):
+    store.put_song(URL, dict(SONG, autoscroll={"mode": "speed"}))
+    store.refresh_song(URL, dict(SONG, autoscroll={"mode": "speed"}))
+    assert "autoscroll" not in store.get_song(URL)
+
+
+def test_upgrade_moves_settings_out_of_song_metadata(tmp_path):
+    path = str(tmp_path / "tabs.db")
+    store = TabsStore(path)
+    store.put_song(URL, SONG)
+    store.close()
+    # Rewind to version 4, where settings were kept with the song
+    conn = sqlite3.connect(path)
+    conn.execute("DROP TABLE song_settings")
+    conn.execute(
+        "UPDATE songs SET meta = ?",
+        (json.dumps({"title": "Song", "artist": "Artist", "autoscroll": AUTOSCROLL}),)
+    )
+    conn.execute("PRAGMA user_version = 4")
+    conn.commit()
+    conn.close()
+
+    store = TabsStore(path)
+    try:
+        store.put_song(URL, SONG)
+        assert store.get_song(URL)["autoscroll"] == AUTOSCROLL
+    finally:
+        store.close()
+
+
+def test_reads_do_not_wait_for_writes(store):
+    store.put_song(URL, SONG)
+    store.put_search("song", [{"song_url": URL}])
+    # The writer thread holds the lock while it compresses and indexes a song
+    with store._lock:
+        assert store.get_song(URL)["tab_content"] == SONG["tab_content"]
+        assert store.get_search("song") == [{"song_url": URL}]
+        assert store.search_songs("artist")[0]["song_url"] == URL
+
+
+def test_reads_see_committed_writes(store):
+    assert store.get_song(URL) is None
+    store.put_song(URL, SONG)
+    store.touch_song(URL)
+    assert store.has_song(URL)
+    assert store.stats()["songs"] == 1